@@ -5,7 +5,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-def create_db_engine(config: Dict[str, Any]) -> Engine:
+def create_db_engine(config: Dict[str, Any], pool_size: int = 10) -> Engine:
     """
     Create a SQLAlchemy engine based on the provided configuration.
     
@@ -17,6 +17,8 @@ def create_db_engine(config: Dict[str, Any]) -> Engine:
             - user: Database user
             - password: Database password
             - database: Database name
+            - probe_on_create: Run a test query before returning (default: False)
+        pool_size (int): Number of pooled connections to keep open
     
     Returns:
         Engine: SQLAlchemy engine instance
@@ -35,11 +37,21 @@ def create_db_engine(config: Dict[str, Any]) -> Engine:
         raise ValueError(f"Unsupported database type: {db_type}")
     
     try:
-        engine = create_engine(connection_string)
-        # Test the connection
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-        logger.info(f"Successfully connected to {db_type} database")
+        # Stale pooled connections are detected lazily by pre-ping on checkout
+        engine = create_engine(
+            connection_string,
+            pool_size=pool_size,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=1800
+        )
+        if config.get('probe_on_create', False):
+            # Test the connection
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            logger.info(f"Successfully connected to {db_type} database")
+        else:
+            logger.info(f"Created {db_type} database engine")
         return engine
     except Exception as e:
         logger.error(f"Failed to create database engine: {str(e)}")
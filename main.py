@@ -1,21 +1,117 @@
 import yaml
+import copy
+import json
 import logging
+import os
+import tempfile
 from loguru import logger
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from connectors.factory import create_db_engine
-from validators.factory import ValidatorFactory
+from utils.settings import validate_settings
+from validators.summary import run_validation
 
-def load_config() -> Dict[str, Any]:
+try:
+    # libyaml C extension, same semantics as SafeLoader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Parsed configs keyed by path, invalidated when the file's mtime or size changes
+_CONFIG_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 16
+
+# Set once logging handlers are installed, so repeated setup doesn't stack handlers
+_LOGGING_READY = False
+
+def _read_config_sidecar(cache_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Read the JSON copy of a settings file if it was written for its current version.
+    
+    Args:
+        cache_path (Path): Path of the JSON sidecar
+        st (os.stat_result): Stat of the YAML settings file
+        
+    Returns:
+        Optional[Dict[str, Any]]: Cached configuration, or None if missing or stale
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get("mtime") == st.st_mtime and cached.get("size") == st.st_size:
+            return cached["config"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache {}: {}", cache_path, e)
+    return None
+
+def _write_config_sidecar(cache_path: Path, st: os.stat_result, config: Dict[str, Any]) -> None:
+    """
+    Atomically write a JSON copy of a parsed settings file next to it.
+    
+    Configurations that don't survive a JSON round-trip unchanged (dates,
+    non-string keys) are not cached.
+    
+    Args:
+        cache_path (Path): Path of the JSON sidecar
+        st (os.stat_result): Stat of the YAML settings file
+        config (Dict[str, Any]): Parsed configuration
+    """
+    try:
+        payload = json.dumps({"mtime": st.st_mtime, "size": st.st_size, "config": config})
+        if json.loads(payload)["config"] != config:
+            return
+        
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug("Could not write config cache {}: {}", cache_path, e)
+
+def load_config(config_path: Path = None) -> Dict[str, Any]:
     """
     Load configuration from settings.yaml
+    
+    The parsed settings are checked against the schema in utils.settings, so
+    missing or mistyped keys fail at startup rather than mid-validation.
+    Repeated loads of an unchanged file are served from an in-memory cache,
+    and across processes from a JSON sidecar (settings.yaml.cache.json).
+    Callers receive their own copy and may modify it freely.
     """
-    config_path = Path(__file__).parent / "config" / "settings.yaml"
+    if config_path is None:
+        config_path = Path(__file__).parent / "config" / "settings.yaml"
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        st = config_path.stat()
+        key = str(config_path)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+            _CONFIG_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
+        
+        cache_path = config_path.with_suffix('.yaml.cache.json')
+        config = _read_config_sidecar(cache_path, st)
+        if config is None:
+            with open(config_path, 'r') as f:
+                config = yaml.load(f, Loader=YamlLoader)
+            validate_settings(config)
+            _write_config_sidecar(cache_path, st, config)
+        
+        _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, config)
+        _CONFIG_CACHE.move_to_end(key)
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.popitem(last=False)
+        
+        return copy.deepcopy(config)
     except Exception as e:
         logger.error(f"Failed to load configuration: {str(e)}")
         sys.exit(1)
@@ -23,7 +119,16 @@ def load_config() -> Dict[str, Any]:
 def setup_logging(config: Dict[str, Any]) -> None:
     """
     Setup logging configuration
+    
+    Log calls pass their arguments to loguru ("{}" placeholders) rather than
+    pre-formatting f-strings, so messages below the configured level are
+    never formatted. Only the first call installs handlers; later calls in the
+    same process are no-ops.
     """
+    global _LOGGING_READY
+    if _LOGGING_READY:
+        return
+    
     log_config = config['logging']
     logger.remove()  # Remove default handler
     
@@ -42,265 +147,8 @@ def setup_logging(config: Dict[str, Any]) -> None:
         format=log_config['format'],
         level=log_config['level']
     )
-
-def run_validation(source_engine, target_engine, config: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Run the validation process using configured validators.
-    
-    Args:
-        source_engine: Source database engine
-        target_engine: Target database engine
-        config (Dict[str, Any]): Configuration dictionary
-        
-    Returns:
-        Dict[str, Any]: Validation results
-    """
-    try:
-        # Log ignored columns configuration
-        ignored_columns = config['validation'].get('ignored_columns', [])
-        if ignored_columns:
-            logger.info(f"Hash validation will ignore these columns: {ignored_columns}")
-        else:
-            logger.info("No columns configured to be ignored during hash validation")
-        
-        # Create validators
-        validators = ValidatorFactory.create_validators(source_engine, target_engine, config)
-        
-        if not validators:
-            return {
-                "status": "error",
-                "error": "No validators configured"
-            }
-        
-        # Run all validators
-        results = {}
-        all_summary = {
-            "total_tables": 0,
-            "passed_tables": [],
-            "failed_tables": [],
-            "error_tables": []
-        }
-        
-        for validator in validators:
-            validator_name = validator.__class__.__name__
-            logger.info(f"Running {validator_name}")
-            validator_results = validator.validate_all()
-            results[validator_name] = validator_results
-            
-            # Generate summary for this validator
-            summary = _generate_validator_summary(validator_name, validator_results)
-            
-            # Update overall summary
-            if all_summary["total_tables"] == 0:  # First validator sets the baseline
-                all_summary["total_tables"] = summary["total_tables"]
-            
-            # Track tables by their worst status across all validators
-            for table in summary["passed_tables"]:
-                if table not in all_summary["failed_tables"] and table not in all_summary["error_tables"]:
-                    if table not in all_summary["passed_tables"]:
-                        all_summary["passed_tables"].append(table)
-            
-            for table in summary["failed_tables"]:
-                if table not in all_summary["error_tables"]:
-                    if table in all_summary["passed_tables"]:
-                        all_summary["passed_tables"].remove(table)
-                    if table not in all_summary["failed_tables"]:
-                        all_summary["failed_tables"].append(table)
-            
-            for table in summary["error_tables"]:
-                if table in all_summary["passed_tables"]:
-                    all_summary["passed_tables"].remove(table)
-                if table in all_summary["failed_tables"]:
-                    all_summary["failed_tables"].remove(table)
-                if table not in all_summary["error_tables"]:
-                    all_summary["error_tables"].append(table)
-        
-        # Print overall summary
-        _print_overall_summary(all_summary)
-        
-        return {
-            "status": "success",
-            "results": results,
-            "summary": all_summary
-        }
-        
-    except Exception as e:
-        logger.error(f"Validation failed: {str(e)}")
-        return {
-            "status": "error",
-            "error": str(e)
-        }
-
-def _generate_validator_summary(validator_name: str, validator_results: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Generate summary statistics for a single validator.
-    
-    Args:
-        validator_name (str): Name of the validator
-        validator_results (Dict[str, Any]): Validation results for all tables
-        
-    Returns:
-        Dict[str, Any]: Summary statistics
-    """
-    passed_tables = []
-    failed_tables = []
-    error_tables = []
-    has_hash_mismatches = False
-    has_missing_rows = False
-    
-    for table_name, result in validator_results.items():
-        if result.get("status") == "success":
-            passed_tables.append(table_name)
-        elif result.get("status") == "mismatch":
-            failed_tables.append(table_name)
-            # Check if this is a hash validator with actual mismatches (not just missing rows)
-            if validator_name == "HashValidator" and "mismatches" in result:
-                hash_mismatches = [m for m in result["mismatches"] if m.get("status") == "hash_mismatch"]
-                if hash_mismatches:
-                    has_hash_mismatches = True
-            # Check if this is a row count validator with missing row detection
-            elif validator_name == "RowCountValidator":
-                missing_in_target = result.get("missing_in_target", [])
-                missing_in_source = result.get("missing_in_source", [])
-                if missing_in_target or missing_in_source:
-                    has_missing_rows = True
-        elif result.get("status") == "error":
-            error_tables.append(table_name)
-    
-    total_tables = len(validator_results)
-    
-    # Print validator-specific summary with clean formatting
-    print(f"\n{'='*60}")
-    print(f"VALIDATION SUMMARY - {validator_name}")
-    print(f"{'='*60}")
-    print(f"Total tables validated: {total_tables}")
-    print(f"✅ Passed: {len(passed_tables)} tables")
-    print(f"❌ Failed: {len(failed_tables)} tables")
-    print(f"⚠️  Errors: {len(error_tables)} tables")
-    
-    if passed_tables:
-        print(f"\n✅ PASSED TABLES:")
-        for table in sorted(passed_tables):
-            print(f"   • {table}")
-    
-    if failed_tables:
-        print(f"\n❌ FAILED TABLES:")
-        for table in sorted(failed_tables):
-            result = validator_results[table]
-            if validator_name == "SampleValidator":
-                source_count = result.get("source_count", 0)
-                target_count = result.get("target_count", 0)
-                print(f"   • {table} (source: {source_count}, target: {target_count})")
-            elif validator_name == "RowCountValidator":
-                source_count = result.get("source_count", 0)
-                target_count = result.get("target_count", 0)
-                diff = result.get("difference", 0)
-                missing_detection_performed = result.get("missing_detection_performed", False)
-                missing_in_target = result.get("missing_in_target", [])
-                missing_in_source = result.get("missing_in_source", [])
-                
-                if missing_detection_performed and (missing_in_target or missing_in_source):
-                    missing_parts = []
-                    if missing_in_target:
-                        missing_parts.append(f"{len(missing_in_target)} missing in target")
-                    if missing_in_source:
-                        missing_parts.append(f"{len(missing_in_source)} missing in source")
-                    print(f"   • {table} (source: {source_count}, target: {target_count}, diff: {diff}, {', '.join(missing_parts)})")
-                else:
-                    print(f"   • {table} (source: {source_count}, target: {target_count}, diff: {diff})")
-            elif validator_name == "HashValidator":
-                if "mismatches" in result:
-                    mismatch_count = len(result["mismatches"])
-                    ignored_cols = result.get("ignored_columns", [])
-                    sampling_used = result.get("sampling_used", False)
-                    
-                    if sampling_used:
-                        sampled_rows = result.get("sampled_rows_source", 0)
-                        total_rows = result.get("total_rows_source", 0)
-                        sample_info = f"sampled {sampled_rows:,}/{total_rows:,} rows"
-                        
-                        if ignored_cols:
-                            print(f"   • {table} ({mismatch_count} hash mismatches in {sample_info}, ignored: {ignored_cols})")
-                        else:
-                            print(f"   • {table} ({mismatch_count} hash mismatches in {sample_info})")
-                    else:
-                        if ignored_cols:
-                            print(f"   • {table} ({mismatch_count} hash mismatches, ignored: {ignored_cols})")
-                        else:
-                            print(f"   • {table} ({mismatch_count} hash mismatches)")
-                else:
-                    print(f"   • {table}")
-            else:
-                print(f"   • {table}")
-    
-    if error_tables:
-        print(f"\n⚠️  ERROR TABLES:")
-        for table in sorted(error_tables):
-            error_msg = validator_results[table].get("error", "Unknown error")
-            print(f"   • {table}: {error_msg}")
-    
-    # Add detailed log instruction for hash validator with mismatches
-    if validator_name == "HashValidator" and has_hash_mismatches:
-        print(f"\n📋 DETAILED LOGS:")
-        print(f"   For row-by-row data comparison of mismatched records,")
-        print(f"   check the detailed logs at: logs/data_checker.log")
-    
-    # Add detailed log instruction for row count validator with missing rows
-    if validator_name == "RowCountValidator" and has_missing_rows:
-        print(f"\n📋 DETAILED LOGS:")
-        print(f"   For detailed missing row identifiers,")
-        print(f"   check the detailed logs at: logs/data_checker.log")
-    
-    print(f"{'='*60}")
-    
-    return {
-        "total_tables": total_tables,
-        "passed_tables": passed_tables,
-        "failed_tables": failed_tables,
-        "error_tables": error_tables
-    }
-
-def _print_overall_summary(summary: Dict[str, Any]) -> None:
-    """
-    Print overall validation summary across all validators.
-    
-    Args:
-        summary (Dict[str, Any]): Overall summary statistics
-    """
-    total = summary["total_tables"]
-    passed = len(summary["passed_tables"])
-    failed = len(summary["failed_tables"])
-    errors = len(summary["error_tables"])
-    
-    print(f"\n{'='*60}")
-    print(f"OVERALL VALIDATION SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total tables: {total}")
-    
-    if total > 0:
-        print(f"✅ Fully matched: {passed} tables ({passed/total*100:.1f}%)")
-        print(f"❌ Mismatched: {failed} tables ({failed/total*100:.1f}%)")
-        print(f"⚠️  Errors: {errors} tables ({errors/total*100:.1f}%)")
-    else:
-        print("⚠️  No tables found to validate")
-        print("   Check your database configuration and table discovery settings")
-    
-    if summary["passed_tables"]:
-        print(f"\n✅ FULLY MATCHED TABLES:")
-        for table in sorted(summary["passed_tables"]):
-            print(f"   • {table}")
-    
-    if summary["failed_tables"]:
-        print(f"\n❌ TABLES WITH MISMATCHES:")
-        for table in sorted(summary["failed_tables"]):
-            print(f"   • {table}")
-    
-    if summary["error_tables"]:
-        print(f"\n⚠️  TABLES WITH ERRORS:")
-        for table in sorted(summary["error_tables"]):
-            print(f"   • {table}")
     
-    print(f"{'='*60}")
+    _LOGGING_READY = True
 
 def main():
     # Load configuration
@@ -310,16 +158,22 @@ def main():
     setup_logging(config)
     
     try:
-        # Create database engines
-        source_engine = create_db_engine(config['source_db'])
-        target_engine = create_db_engine(config['target_db'])
+        # Create database engines, sized so concurrent validators don't wait on pool checkout
+        parallel_tables = config['validation'].get('parallel_tables', 1)
+        pool_size = len(config['validation']['types']) * parallel_tables + 2
+        # Both engines are independent, so their connection handshakes can overlap
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(create_db_engine, config['source_db'], pool_size)
+            target_future = executor.submit(create_db_engine, config['target_db'], pool_size)
+            source_engine = source_future.result()
+            target_engine = target_future.result()
         
         # Run validation
         results = run_validation(source_engine, target_engine, config)
-        logger.info(f"Validation completed with status: {results['status']}")
+        logger.info("Validation completed with status: {}", results['status'])
         
     except Exception as e:
-        logger.error(f"Application failed to start: {str(e)}")
+        logger.error("Application failed to start: {}", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+from typing import Any, Dict, List, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class DatabaseSettings(BaseModel):
+    """Connection settings for the source or target database."""
+    model_config = ConfigDict(extra='allow')
+
+    type: str
+    host: str
+    port: int
+    user: Union[str, int]
+    password: Optional[Union[str, int]] = None
+    database: str
+    probe_on_create: bool = False
+
+
+class ValidationSettings(BaseModel):
+    """Validation settings shared by all validators."""
+    model_config = ConfigDict(extra='allow')
+
+    types: List[str]
+    chunk_size: Optional[int] = Field(default=None, gt=0)
+    parallel_tables: int = Field(default=1, ge=1)
+    ignored_columns: List[str] = []
+
+    @model_validator(mode='after')
+    def _chunk_size_for_hash_check(self) -> 'ValidationSettings':
+        # Only the hash check reads tables in chunks
+        if 'hash_check' in self.types and self.chunk_size is None:
+            raise ValueError("chunk_size is required when hash_check is enabled")
+        return self
+
+
+class TablesSettings(BaseModel):
+    """Table selection settings."""
+    model_config = ConfigDict(extra='allow')
+
+    include: Optional[List[str]] = None
+    exclude: Optional[List[str]] = None
+
+
+class LoggingSettings(BaseModel):
+    """Log handler settings."""
+    model_config = ConfigDict(extra='allow')
+
+    level: str
+    file: str
+    max_size: Union[int, str]
+    backup_count: int
+    format: str
+
+
+class Settings(BaseModel):
+    """Schema of config/settings.yaml. Unknown keys are allowed and passed through."""
+    model_config = ConfigDict(extra='allow')
+
+    source_db: DatabaseSettings
+    target_db: DatabaseSettings
+    validation: ValidationSettings
+    tables: TablesSettings
+    logging: LoggingSettings
+
+
+def validate_settings(config: Dict[str, Any]) -> None:
+    """
+    Validate a parsed configuration against the settings schema.
+
+    The configuration itself is left untouched; callers keep using the dict.
+
+    Args:
+        config (Dict[str, Any]): Parsed configuration
+
+    Raises:
+        pydantic.ValidationError: If required settings are missing or have the wrong type
+    """
+    Settings.model_validate(config)
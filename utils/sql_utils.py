@@ -1,40 +1,55 @@
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, Callable
+from collections import namedtuple
+from functools import lru_cache
+import sys
+import threading
+import weakref
 from sqlalchemy.engine import Engine
-from sqlalchemy import MetaData, Table, text
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.mysql.reserved_words import RESERVED_WORDS_MYSQL, RESERVED_WORDS_MARIADB
+from sqlalchemy.dialects.postgresql.base import RESERVED_WORDS as POSTGRESQL_RESERVED_WORDS
 from loguru import logger
 
-# MySQL/MariaDB reserved keywords that need escaping
-MYSQL_RESERVED_KEYWORDS = {
-    'order', 'type', 'status', 'key', 'value', 'group', 'user', 'role', 'index', 'unique',
-    'primary', 'foreign', 'constraint', 'table', 'database', 'schema', 'view', 'trigger',
-    'procedure', 'function', 'cursor', 'declare', 'begin', 'end', 'if', 'then', 'else',
-    'when', 'case', 'while', 'loop', 'repeat', 'leave', 'iterate', 'return', 'call',
-    'select', 'insert', 'update', 'delete', 'create', 'drop', 'alter', 'grant', 'revoke',
-    'commit', 'rollback', 'savepoint', 'lock', 'unlock', 'desc', 'asc', 'limit', 'offset',
-    'union', 'intersect', 'except', 'exists', 'in', 'between', 'like', 'regexp', 'match',
-    'and', 'or', 'not', 'xor', 'is', 'null', 'true', 'false', 'distinct', 'all', 'any',
-    'some', 'as', 'on', 'using', 'join', 'inner', 'outer', 'left', 'right', 'full',
-    'cross', 'natural', 'where', 'having', 'order', 'group', 'by', 'into', 'values',
-    'set', 'from', 'with', 'recursive', 'window', 'partition', 'over', 'rows', 'range',
-    'unbounded', 'preceding', 'following', 'current', 'row', 'show', 'double', 'float', 'int',
+# MySQL/MariaDB reserved keywords that need escaping, on top of SQLAlchemy's own lists
+MYSQL_RESERVED_KEYWORDS = frozenset({
+    'all', 'alter', 'and', 'any', 'as', 'asc', 'begin', 'between', 'by', 'call', 'case',
+    'commit', 'constraint', 'create', 'cross', 'current', 'cursor', 'database',
+    'declare', 'delete', 'desc', 'distinct', 'double', 'drop', 'else', 'end', 'except',
+    'exists', 'false', 'float', 'following', 'foreign', 'from', 'full', 'function',
+    'grant', 'group', 'having', 'if', 'in', 'index', 'inner', 'insert', 'int',
+    'intersect', 'into', 'is', 'iterate', 'join', 'key', 'leave', 'left', 'like',
+    'limit', 'lock', 'loop', 'match', 'natural', 'not', 'null', 'offset', 'on', 'or',
+    'order', 'outer', 'over', 'partition', 'preceding', 'primary', 'procedure', 'range',
+    'recursive', 'regexp', 'repeat', 'return', 'revoke', 'right', 'role', 'rollback',
+    'row', 'rows', 'savepoint', 'schema', 'select', 'set', 'show', 'some', 'status',
+    'table', 'then', 'trigger', 'true', 'type', 'unbounded', 'union', 'unique',
+    'unlock', 'update', 'user', 'using', 'value', 'values', 'view', 'when', 'where',
+    'while', 'window', 'with', 'xor',
     # Additional problematic keywords found in practice
-    'saldo', 'keterangan', 'note', 'dtu', 'tipe', 'active', 'coa', 'default'
-}
+    'active', 'coa', 'default', 'dtu', 'keterangan', 'note', 'saldo', 'tipe'
+}) | RESERVED_WORDS_MYSQL | RESERVED_WORDS_MARIADB
+
+# PostgreSQL reserved keywords that need escaping, on top of SQLAlchemy's own list
+POSTGRESQL_RESERVED_KEYWORDS = frozenset({
+    'all', 'alter', 'and', 'any', 'as', 'asc', 'begin', 'between', 'by', 'call', 'case',
+    'commit', 'constraint', 'create', 'cross', 'current', 'cursor', 'database',
+    'declare', 'delete', 'desc', 'distinct', 'double', 'drop', 'else', 'end', 'except',
+    'exists', 'false', 'float', 'following', 'foreign', 'from', 'full', 'function',
+    'grant', 'group', 'having', 'if', 'ilike', 'in', 'index', 'inner', 'insert', 'int',
+    'intersect', 'into', 'is', 'join', 'key', 'left', 'like', 'limit', 'lock', 'loop',
+    'natural', 'not', 'null', 'offset', 'on', 'or', 'order', 'outer', 'over',
+    'partition', 'preceding', 'primary', 'procedure', 'range', 'recursive', 'return',
+    'revoke', 'right', 'role', 'rollback', 'row', 'rows', 'savepoint', 'schema',
+    'select', 'set', 'similar', 'some', 'table', 'then', 'trigger', 'true', 'type',
+    'unbounded', 'union', 'unique', 'update', 'user', 'using', 'value', 'values',
+    'view', 'when', 'where', 'while', 'window', 'with'
+}) | POSTGRESQL_RESERVED_WORDS
 
-# PostgreSQL reserved keywords that need escaping  
-POSTGRESQL_RESERVED_KEYWORDS = {
-    'order', 'type', 'user', 'group', 'key', 'value', 'role', 'index', 'unique', 'primary',
-    'foreign', 'constraint', 'table', 'database', 'schema', 'view', 'trigger', 'procedure',
-    'function', 'cursor', 'declare', 'begin', 'end', 'if', 'then', 'else', 'when', 'case',
-    'while', 'loop', 'return', 'call', 'select', 'insert', 'update', 'delete', 'create',
-    'drop', 'alter', 'grant', 'revoke', 'commit', 'rollback', 'savepoint', 'lock', 'desc',
-    'asc', 'limit', 'offset', 'union', 'intersect', 'except', 'exists', 'in', 'between',
-    'like', 'ilike', 'similar', 'and', 'or', 'not', 'is', 'null', 'true', 'false',
-    'distinct', 'all', 'any', 'some', 'as', 'on', 'using', 'join', 'inner', 'outer',
-    'left', 'right', 'full', 'cross', 'natural', 'where', 'having', 'order', 'group',
-    'by', 'into', 'values', 'set', 'from', 'with', 'recursive', 'window', 'partition',
-    'over', 'rows', 'range', 'unbounded', 'preceding', 'following', 'current', 'row',
-    'double', 'float', 'int'
+# Identifier quote character and reserved keywords per database type
+_QUOTE_BY_DB = {
+    'mysql': ('`', MYSQL_RESERVED_KEYWORDS),
+    'mariadb': ('`', MYSQL_RESERVED_KEYWORDS),
+    'postgresql': ('"', POSTGRESQL_RESERVED_KEYWORDS),
 }
 
 
@@ -51,10 +66,14 @@ def get_database_type(engine: Engine) -> str:
     return engine.name.lower()
 
 
+@lru_cache(maxsize=4096)
 def escape_column_name(column_name: str, db_type: str) -> str:
     """
     Escape column name if it's a reserved keyword for the given database type.
     
+    Results are memoized, since the same few column and table names are
+    escaped over and over while building queries.
+    
     Args:
         column_name: The column name to potentially escape
         db_type: Database type ('mysql', 'postgresql', etc.)
@@ -62,18 +81,36 @@ def escape_column_name(column_name: str, db_type: str) -> str:
     Returns:
         str: Escaped column name if needed, otherwise original name
     """
-    column_lower = column_name.lower()
+    entry = _QUOTE_BY_DB.get(db_type)
+    if entry is None:
+        return column_name
     
-    if db_type in ['mysql', 'mariadb']:
-        if column_lower in MYSQL_RESERVED_KEYWORDS:
-            return f"`{column_name}`"
-    elif db_type == 'postgresql':
-        if column_lower in POSTGRESQL_RESERVED_KEYWORDS:
-            return f'"{column_name}"'
+    quote, keywords = entry
+    if _is_reserved(column_name, keywords):
+        return f"{quote}{column_name}{quote}"
     
     return column_name
 
 
+def _is_reserved(column_name: str, keywords: frozenset) -> bool:
+    """
+    Check a name against a lowercase keyword set, case-insensitively.
+    
+    Already-lowercase names (the common case) are looked up as-is, without
+    allocating a lowered copy.
+    
+    Args:
+        column_name: The column name to check
+        keywords: Lowercase reserved keywords
+        
+    Returns:
+        bool: True if the name is a reserved keyword
+    """
+    if column_name in keywords:
+        return True
+    return not column_name.islower() and column_name.lower() in keywords
+
+
 def escape_column_list(columns: List[str], db_type: str) -> List[str]:
     """
     Escape a list of column names for reserved keywords.
@@ -88,80 +125,185 @@ def escape_column_list(columns: List[str], db_type: str) -> List[str]:
     return [escape_column_name(col, db_type) for col in columns]
 
 
-def get_table_columns(table_name: str, engine: Engine) -> List[str]:
+def escape_and_join(columns: List[str], db_type: str, sep: str = ', ') -> str:
     """
-    Get all column names for a table.
+    Escape column names and join them, without building an intermediate list.
+    
+    Args:
+        columns: List of column names
+        db_type: Database type ('mysql', 'postgresql', etc.)
+        sep: Separator placed between the escaped names
+        
+    Returns:
+        str: Escaped column names joined by sep
+    """
+    return sep.join(escape_column_name(col, db_type) for col in columns)
+
+
+def get_table_row_counts(engine: Engine, table_names: List[str], batch_size: int = 200) -> Dict[str, int]:
+    """
+    Count rows for many tables using one UNION ALL query per batch of tables.
+    
+    Tables whose batch fails (e.g. a table missing on this side) are left out
+    of the result so callers can fall back to counting them individually.
     
     Args:
-        table_name: Name of the table
         engine: SQLAlchemy engine
+        table_names: Names of the tables to count
+        batch_size: Maximum number of tables per query
         
     Returns:
-        List[str]: List of column names
+        Dict[str, int]: Row count per table name
     """
-    try:
-        metadata = MetaData()
-        table = Table(table_name, metadata, autoload_with=engine)
-        return [col.name for col in table.columns]
-    except Exception as e:
-        logger.error(f"Error getting columns for table {table_name}: {str(e)}")
-        return []
+    db_type = get_database_type(engine)
+    counts = {}
+    
+    for start in range(0, len(table_names), batch_size):
+        batch = table_names[start:start + batch_size]
+        query = " UNION ALL ".join(
+            f"SELECT {i} AS table_index, COUNT(*) AS row_count FROM {escape_column_name(table, db_type)}"
+            for i, table in enumerate(batch)
+        )
+        try:
+            with engine.connect() as conn:
+                for table_index, row_count in conn.execute(text(query)):
+                    counts[batch[table_index]] = row_count
+        except Exception as e:
+            logger.warning(f"Batched row count failed, tables will be counted individually: {str(e)}")
+    
+    return counts
+
+
+# Reflected schema of a table; tuples so cached entries can't be mutated by callers
+TableSchema = namedtuple('TableSchema', ['columns', 'pk_columns', 'unique_constraints'])
 
+# Table schemas per engine, then per table name; see get_table_schema. Keyed by the
+# Engine itself, weakly, so a discarded engine's entries go with it
+_reflection_cache: "weakref.WeakKeyDictionary[Engine, Dict[str, TableSchema]]" = weakref.WeakKeyDictionary()
+_reflection_lock = threading.Lock()
 
-def get_primary_key_columns(table_name: str, engine: Engine) -> List[str]:
+
+def _engine_schemas(engine: Engine) -> Dict[str, TableSchema]:
     """
-    Get primary key columns for a table.
+    Get the cached table schemas of an engine, creating its entry on first use.
     
     Args:
-        table_name: Name of the table
         engine: SQLAlchemy engine
         
     Returns:
-        List[str]: List of primary key column names (empty if no primary key)
+        Dict[str, TableSchema]: Schema per table name (update under _reflection_lock)
     """
-    try:
-        metadata = MetaData()
-        table = Table(table_name, metadata, autoload_with=engine)
-        pk_columns = [c.name for c in table.primary_key.columns]
+    with _reflection_lock:
+        schemas = _reflection_cache.get(engine)
+        if schemas is None:
+            schemas = _reflection_cache[engine] = {}
+        return schemas
+
+
+def _table_schema(columns: List[Dict[str, Any]], pk_constraint: Dict[str, Any], unique_constraints: List[Dict[str, Any]]) -> TableSchema:
+    """
+    Build the cached schema entry from Inspector results.
+    
+    Column names are interned, so the same name used as a row dict key across
+    many rows is one shared string and dict lookups hit the identity check.
+    
+    Args:
+        columns: Result of Inspector.get_columns
+        pk_constraint: Result of Inspector.get_pk_constraint
+        unique_constraints: Result of Inspector.get_unique_constraints
         
-        if pk_columns:
-            logger.debug(f"Table {table_name} has primary key: {pk_columns}")
-        else:
-            logger.warning(f"Table {table_name} has no primary key defined")
-            
-        return pk_columns
-    except Exception as e:
-        logger.error(f"Error getting primary key for table {table_name}: {str(e)}")
-        return []
+    Returns:
+        TableSchema: (columns, pk_columns, unique_constraints), all as tuples
+    """
+    return TableSchema(
+        columns=tuple(sys.intern(col['name']) for col in columns),
+        pk_columns=tuple(sys.intern(col) for col in pk_constraint.get('constrained_columns') or ()),
+        unique_constraints=tuple(
+            tuple(sys.intern(col) for col in constraint['column_names']) for constraint in unique_constraints if constraint['column_names']
+        )
+    )
 
 
-def get_unique_columns(table_name: str, engine: Engine) -> List[List[str]]:
+def get_table_schema(table_name: str, engine: Engine) -> TableSchema:
     """
-    Get unique constraint columns for a table.
+    Reflect a table's columns, primary key and unique constraints once per engine.
+    
+    Uses the targeted Inspector queries rather than autoloading a full Table
+    (indexes, foreign keys, comments...). Later calls for the same engine and
+    table are served from memory.
     
     Args:
         table_name: Name of the table
         engine: SQLAlchemy engine
         
     Returns:
-        List[List[str]]: List of unique constraints, each containing column names
+        TableSchema: (columns, pk_columns, unique_constraints), all as tuples
+        
+    Raises:
+        Exception: If the table can't be reflected
     """
+    schemas = _engine_schemas(engine)
+    schema = schemas.get(table_name)
+    if schema is None:
+        # A fresh Inspector per reflection; its info_cache isn't safe to share between threads
+        inspector = inspect(engine)
+        schema = _table_schema(
+            inspector.get_columns(table_name),
+            inspector.get_pk_constraint(table_name),
+            inspector.get_unique_constraints(table_name)
+        )
+        with _reflection_lock:
+            schema = schemas.setdefault(table_name, schema)
+    return schema
+
+
+def prime_reflection_cache(engine: Engine, table_names: List[str]) -> None:
+    """
+    Reflect many tables with the Inspector's bulk get_multi_* methods and cache their schemas.
+    
+    One query per kind of object (columns, primary keys, unique constraints)
+    covers every table, which is far fewer round-trips than reflecting them
+    one by one. Tables missing on this side are skipped, and if bulk
+    reflection fails altogether tables are left to be reflected lazily by
+    get_table_schema.
+    
+    Args:
+        engine: SQLAlchemy engine
+        table_names: Names of the tables to reflect
+    """
+    schemas = _engine_schemas(engine)
+    missing = [name for name in table_names if name not in schemas]
+    if not missing:
+        return
+    
     try:
-        metadata = MetaData()
-        table = Table(table_name, metadata, autoload_with=engine)
-        
-        unique_constraints = []
-        for constraint in table.constraints:
-            if hasattr(constraint, 'columns') and len(constraint.columns) > 0:
-                # Check if it's a unique constraint (not primary key)
-                if constraint.__class__.__name__ == 'UniqueConstraint':
-                    constraint_cols = [col.name for col in constraint.columns]
-                    unique_constraints.append(constraint_cols)
-        
-        return unique_constraints
+        inspector = inspect(engine)
+        columns = inspector.get_multi_columns(filter_names=missing)
+        pk_constraints = inspector.get_multi_pk_constraint(filter_names=missing)
+        unique_constraints = inspector.get_multi_unique_constraints(filter_names=missing)
     except Exception as e:
-        logger.error(f"Error getting unique constraints for table {table_name}: {str(e)}")
-        return []
+        logger.debug(f"Bulk reflection failed, tables will be reflected individually: {str(e)}")
+        return
+    
+    with _reflection_lock:
+        for key, table_columns in columns.items():
+            schemas.setdefault(key[1], _table_schema(
+                table_columns, pk_constraints.get(key, {}), unique_constraints.get(key, [])
+            ))
+
+
+def get_table_names(engine: Engine, schema: str = None) -> List[str]:
+    """
+    List the base tables (no views) of a schema through an Inspector.
+    
+    Args:
+        engine: SQLAlchemy engine
+        schema: Schema to list (default: the connection's default schema)
+        
+    Returns:
+        List[str]: Table names
+    """
+    return inspect(engine).get_table_names(schema=schema)
 
 
 def get_suitable_row_identifier(table_name: str, engine: Engine, available_columns: List[str] = None) -> Tuple[List[str], str]:
@@ -182,13 +324,22 @@ def get_suitable_row_identifier(table_name: str, engine: Engine, available_colum
         Tuple[List[str], str]: (identifier_columns, identifier_type)
         identifier_type can be: 'primary_key', 'unique_constraint', 'all_columns'
     """
-    # Get primary key columns
-    pk_columns = get_primary_key_columns(table_name, engine)
+    # Read keys, unique constraints and columns off a single reflection
+    try:
+        schema = get_table_schema(table_name, engine)
+        pk_columns = list(schema.pk_columns)
+        unique_constraints = [list(cols) for cols in schema.unique_constraints]
+        table_columns = list(schema.columns)
+    except Exception as e:
+        logger.error(f"Error reflecting table {table_name}: {str(e)}")
+        pk_columns, unique_constraints, table_columns = [], [], []
+    
+    available_set = frozenset(available_columns) if available_columns else None
     
     if pk_columns:
         # Filter primary key columns by available columns if specified
-        if available_columns:
-            pk_columns = [col for col in pk_columns if col in available_columns]
+        if available_set:
+            pk_columns = [col for col in pk_columns if col in available_set]
             if pk_columns:
                 return pk_columns, 'primary_key'
         else:
@@ -197,12 +348,10 @@ def get_suitable_row_identifier(table_name: str, engine: Engine, available_colum
     logger.warning(f"Table {table_name} has no primary key, checking for unique constraints...")
     
     # Try to find unique constraints
-    unique_constraints = get_unique_columns(table_name, engine)
-    
     for unique_cols in unique_constraints:
         # Filter by available columns if specified
-        if available_columns:
-            filtered_unique = [col for col in unique_cols if col in available_columns]
+        if available_set:
+            filtered_unique = [col for col in unique_cols if col in available_set]
             if len(filtered_unique) == len(unique_cols):  # All unique columns are available
                 logger.info(f"Using unique constraint {filtered_unique} as row identifier for table {table_name}")
                 return filtered_unique, 'unique_constraint'
@@ -214,7 +363,7 @@ def get_suitable_row_identifier(table_name: str, engine: Engine, available_colum
     if available_columns:
         all_cols = available_columns
     else:
-        all_cols = get_table_columns(table_name, engine)
+        all_cols = table_columns
     
     logger.warning(
         f"Table {table_name} has no primary key or unique constraints. "
@@ -248,71 +397,366 @@ def build_select_query(
     Returns:
         str: Complete SELECT query
     """
-    escaped_columns = escape_column_list(columns, db_type)
+    return make_select_builder(columns, table_name, db_type, order_by)(where_clause, limit, offset)
+
+
+def make_select_builder(
+    columns: List[str],
+    table_name: str,
+    db_type: str,
+    order_by: List[str] = None,
+    expressions: List[str] = None
+) -> Callable[[Optional[str], Optional[int], Optional[int]], str]:
+    """
+    Precompute the fixed parts of a SELECT query for repeated (e.g. paginated) use.
+    
+    Args:
+        columns: List of column names to select
+        table_name: Name of the table
+        db_type: Database type
+        order_by: Optional list of columns to order by
+        expressions: Optional SQL expressions selected after the columns (not escaped)
+        
+    Returns:
+        Callable: build(where_clause=None, limit=None, offset=None) returning the
+        same query as build_select_query with those arguments
+    """
     escaped_table = escape_column_name(table_name, db_type)
     
-    query = f"SELECT {', '.join(escaped_columns)} FROM {escaped_table}"
+    select_list = escape_column_list(columns, db_type) + list(expressions or ())
+    head = f"SELECT {', '.join(select_list)} FROM {escaped_table}"
+    order_tail = f" ORDER BY {escape_and_join(order_by, db_type)}" if order_by else ""
+    
+    def build(where_clause: str = None, limit: int = None, offset: int = None) -> str:
+        parts = [head]
+        if where_clause:
+            parts += (" WHERE ", where_clause)
+        parts.append(order_tail)
+        if limit is not None:
+            parts += (" LIMIT ", str(limit))
+        if offset is not None:
+            parts += (" OFFSET ", str(offset))
+        return "".join(parts)
+    
+    return build
+
+
+def build_row_hash_expression(columns: List[str], db_type: str) -> str:
+    """
+    Build a SQL expression that hashes a row's values on the database server.
     
-    if where_clause:
-        query += f" WHERE {where_clause}"
+    The result is an MD5 hex digest, so only the digest crosses the network.
+    Digests are only comparable between databases of the same type, since
+    each renders values to text in its own way.
     
-    if order_by:
-        escaped_order_cols = escape_column_list(order_by, db_type)
-        query += f" ORDER BY {', '.join(escaped_order_cols)}"
+    Args:
+        columns: Columns to include in the hash, in order
+        db_type: Database type
+        
+    Returns:
+        str: SQL expression evaluating to the row hash
+        
+    Raises:
+        ValueError: If the database type has no server-side row hash
+    """
+    if db_type == 'postgresql':
+        return f"md5(ROW({escape_and_join(columns, db_type)})::text)"
+    if db_type == 'mysql':
+        # CONCAT_WS skips NULLs, so each value is tagged: 'v' + value, or 'n' for NULL
+        tagged = ", ".join([f"COALESCE(CONCAT('v', {col}), 'n')" for col in escape_column_list(columns, db_type)])
+        return f"MD5(CONCAT_WS(CHAR(1), {tagged}))"
+    raise ValueError(f"Server-side row hashing is not supported for {db_type}")
+
+
+def build_table_fingerprint_query(columns: List[str], table_name: str, db_type: str, order_by: List[str]) -> str:
+    """
+    Build a query returning a table's row count and a digest over all its row hashes.
     
-    if limit is not None:
-        query += f" LIMIT {limit}"
+    Row hashes are aggregated in order_by order (PostgreSQL) or XOR-folded
+    (MySQL), so two tables with the same rows produce the same fingerprint.
+    XOR folding cancels out identical rows, so the fingerprint is only
+    meaningful for tables with a primary key. Like build_row_hash_expression,
+    the result is only comparable between databases of the same type.
     
-    if offset is not None:
-        query += f" OFFSET {offset}"
+    Args:
+        columns: Columns to include in the row hashes, in order
+        table_name: Name of the table
+        db_type: Database type
+        order_by: Primary key columns, which order the rows uniquely
+        
+    Returns:
+        str: Query selecting (row_count, fingerprint)
+        
+    Raises:
+        ValueError: If the database type has no server-side row hash
+    """
+    row_hash = build_row_hash_expression(columns, db_type)
+    escaped_table = escape_column_name(table_name, db_type)
+    if db_type == 'postgresql':
+        return (
+            f"SELECT COUNT(*), md5(string_agg({row_hash}, '' ORDER BY {escape_and_join(order_by, db_type)})) "
+            f"FROM {escaped_table}"
+        )
+    if db_type == 'mysql':
+        # GROUP_CONCAT is truncated at group_concat_max_len, so the row hashes are
+        # XOR-folded instead; identical rows cancel out, so order_by must be a primary key
+        return (
+            f"SELECT COUNT(*), CONCAT("
+            f"BIT_XOR(CAST(CONV(LEFT(h, 16), 16, 10) AS UNSIGNED)), '-', "
+            f"BIT_XOR(CAST(CONV(RIGHT(h, 16), 16, 10) AS UNSIGNED))) "
+            f"FROM (SELECT {row_hash} AS h FROM {escaped_table}) AS row_hashes"
+        )
+    raise ValueError(f"Table fingerprints are not supported for {db_type}")
+
+
+def make_keyset_where(key_columns: List[str], db_type: str) -> str:
+    """
+    Build the WHERE clause that selects rows after a key, for keyset pagination.
+    
+    Composite keys use a row-value comparison on PostgreSQL, so rows ordered
+    by key_columns continue exactly after the last row of the previous page.
+    MySQL gets the equivalent lexicographic expansion, led by a range on the
+    first column so the optimizer can seek into the key index.
     
-    return query
+    Args:
+        key_columns: Columns the query is ordered by (must be non-null and unique)
+        db_type: Database type
+        
+    Returns:
+        str: WHERE clause with :k0, :k1, ... parameter markers
+    """
+    escaped_columns = escape_column_list(key_columns, db_type)
+    if len(escaped_columns) == 1:
+        return f"{escaped_columns[0]} > :k0"
+    if db_type == 'mysql':
+        terms = []
+        for i, col in enumerate(escaped_columns):
+            equal_prefix = [f"{prev} = :k{j}" for j, prev in enumerate(escaped_columns[:i])]
+            terms.append("(" + " AND ".join(equal_prefix + [f"{col} > :k{i}"]) + ")")
+        return f"{escaped_columns[0]} >= :k0 AND ({' OR '.join(terms)})"
+    markers = ", ".join([f":k{i}" for i in range(len(escaped_columns))])
+    return f"({', '.join(escaped_columns)}) > ({markers})"
 
 
-def build_where_clause_for_pk(pk_columns: List[str], pk_values: tuple, db_type: str) -> str:
+def make_pk_where_template(pk_columns: List[str], db_type: str) -> str:
     """
-    Build a WHERE clause for primary key matching with proper escaping.
+    Build the parameterized WHERE clause for primary key matching once per table.
     
     Args:
         pk_columns: List of primary key column names
+        db_type: Database type
+        
+    Returns:
+        str: WHERE clause with :pk0, :pk1, ... parameter markers
+    """
+    escaped_columns = escape_column_list(pk_columns, db_type)
+    return " AND ".join([f"{col} = :pk{i}" for i, col in enumerate(escaped_columns)])
+
+
+def build_where_clause_for_pk_fast(template: str, pk_values: tuple) -> Tuple[str, Dict[str, Any]]:
+    """
+    Pair a prebuilt primary key WHERE clause with the parameters for one row.
+    
+    Args:
+        template: WHERE clause from make_pk_where_template
         pk_values: Tuple of primary key values
+        
+    Returns:
+        Tuple[str, Dict[str, Any]]: (WHERE clause, bound parameters)
+    """
+    return template, {f"pk{i}": val for i, val in enumerate(pk_values)}
+
+
+def build_where_clause_for_pk_batch(pk_columns: List[str], pk_values_list: List[tuple], db_type: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a parameterized WHERE clause matching any of several primary key values.
+    
+    Composite keys use a row-value IN list, e.g. (a, b) IN ((:pk0_0, :pk0_1), ...).
+    
+    Args:
+        pk_columns: List of primary key column names
+        pk_values_list: Primary key value tuples to match
         db_type: Database type
         
     Returns:
-        str: WHERE clause string
+        Tuple[str, Dict[str, Any]]: (WHERE clause, bound parameters)
     """
     escaped_columns = escape_column_list(pk_columns, db_type)
+    params = {}
+    tuples = []
+    for r, pk_values in enumerate(pk_values_list):
+        markers = []
+        for c, val in enumerate(pk_values):
+            params[f"pk{r}_{c}"] = val
+            markers.append(f":pk{r}_{c}")
+        tuples.append(markers[0] if len(markers) == 1 else f"({', '.join(markers)})")
+    
+    key = escaped_columns[0] if len(escaped_columns) == 1 else f"({', '.join(escaped_columns)})"
+    return f"{key} IN ({', '.join(tuples)})", params
+
+
+def make_row_signer(column_names: List[str], identifier_columns: List[str]) -> Callable[[Any], str]:
+    """
+    Build a function computing a row's signature, specialized for one table's layout.
     
-    if len(pk_columns) == 1:
-        return f"{escaped_columns[0]} = '{pk_values[0]}'"
-    else:
-        conditions = []
-        for i, col in enumerate(escaped_columns):
-            conditions.append(f"{col} = '{pk_values[i]}'")
-        return " AND ".join(conditions)
+    The identifier positions are resolved once, so the returned function does
+    no column lookups per row; build it once per table scan. Signatures are
+    the '|'-joined identifier values, so they stay readable in logs and
+    mismatch records and key-based ones can be split back into key values.
+    
+    Args:
+        column_names: Column names of the fetched rows, in order
+        identifier_columns: Identifier column names
+        
+    Returns:
+        Callable[[Any], str]: signer(row) returning the row signature
+    """
+    indices = [column_names.index(col) for col in identifier_columns if col in column_names]
+    
+    if len(indices) == 1:
+        # Single-column key, the common case
+        index = indices[0]
+        return lambda row: str(row[index])
+    
+    return lambda row: '|'.join([str(row[i]) for i in indices])
 
 
-def create_row_signature(row_data: List, identifier_columns: List[str], identifier_type: str) -> str:
+def create_row_signatures_batch(rows: List, column_names: List[str], identifier_columns: List[str], identifier_type: str) -> List[str]:
     """
-    Create a row signature for identification purposes.
+    Create row signatures for a fetched batch of rows in one call.
+    
+    Scans that sign many batches of the same table should call
+    make_row_signer once instead.
     
     Args:
-        row_data: List of row values
+        rows: Rows whose values are in column_names order
+        column_names: Column names of the fetched rows
         identifier_columns: List of identifier column names
         identifier_type: Type of identifier ('primary_key', 'unique_constraint', 'all_columns')
         
     Returns:
-        str: Row signature string
+        List[str]: Row signature per row, in the same order as rows
     """
-    if identifier_type == 'all_columns':
-        # For all_columns type, use all values
-        return '|'.join(str(val) for val in row_data)
-    else:
-        # For primary_key and unique_constraint, use only identifier columns
-        # This assumes row_data is in the same order as the full column list
-        # and we need to extract only the identifier columns
-        # This is a simplified version - in practice, you'd need to map columns properly
-        return '|'.join(str(val) for val in row_data[:len(identifier_columns)])
+    return list(map(make_row_signer(column_names, identifier_columns), rows))
+
+
+def precompute_table_escapes(table_name: str, all_columns: List[str], db_type: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Escape a table name and its columns once, for reuse across many generated queries.
+    
+    Args:
+        table_name: Name of the table
+        all_columns: Column names of the table
+        db_type: Database type ('mysql', 'postgresql', etc.)
+        
+    Returns:
+        Tuple[str, Dict[str, str]]: (escaped_table, escaped name per column)
+    """
+    return (
+        escape_column_name(table_name, db_type),
+        {col: escape_column_name(col, db_type) for col in all_columns}
+    )
+
+
+def _quote_literal(val: Any) -> str:
+    """Render a value as a quoted SQL string literal, escaping single quotes."""
+    escaped_val = str(val).replace("'", "''")
+    return f"'{escaped_val}'"
+
+
+# Literal renderer per exact value type; anything else (dates, decimals, ...) is quoted
+_LITERAL_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda val: "NULL",
+    str: _quote_literal,
+    int: str,
+    float: str,
+    bool: lambda val: "1" if val else "0",
+}
+
+
+def _sql_literal(val: Any) -> str:
+    """
+    Render a value as an inline SQL literal for generated fix query files.
+    
+    Dispatches on the exact type, so bool (a subclass of int) renders as 1/0.
+    Other int and float subclasses render as numbers; anything else is quoted.
+    
+    Args:
+        val: Value to render
+        
+    Returns:
+        str: SQL literal
+    """
+    formatter = _LITERAL_FORMATTERS.get(type(val))
+    if formatter is not None:
+        return formatter(val)
+    if isinstance(val, (int, float)):
+        return str(val)
+    return _quote_literal(val)
+
+
+def _bulk_insert_chunks(
+    rows: List[Dict[str, Any]],
+    ignored_columns: Optional[List[str]],
+    max_rows: int
+) -> List[Tuple[Tuple[str, ...], List[List[Any]]]]:
+    """
+    Group rows by their (non-ignored) column set and split each group into chunks.
+    
+    Args:
+        rows: Rows as dictionaries
+        ignored_columns: List of columns to leave out
+        max_rows: Maximum number of rows per chunk
+        
+    Returns:
+        List[Tuple[Tuple[str, ...], List[List[Any]]]]: (columns, row values) per chunk,
+        in first-seen order of the column sets
+    """
+    if ignored_columns is None:
+        ignored_columns = []
+    
+    groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+    for row in rows:
+        columns = tuple(col for col in row if col not in ignored_columns)
+        if columns:
+            groups.setdefault(columns, []).append([row[col] for col in columns])
+    
+    chunks = []
+    for columns, values in groups.items():
+        # Stay under the 65535 bind parameter limit of PostgreSQL/MySQL
+        chunk_rows = max(1, min(max_rows, 65535 // len(columns)))
+        for start in range(0, len(values), chunk_rows):
+            chunks.append((columns, values[start:start + chunk_rows]))
+    return chunks
+
+
+def generate_bulk_insert_queries(
+    table_name: str,
+    rows: List[Dict[str, Any]],
+    db_type: str,
+    ignored_columns: List[str] = None,
+    max_rows: int = 1000
+) -> List[str]:
+    """
+    Generate multi-row MySQL INSERT queries, with inline values, for a fix query file.
+    
+    Args:
+        table_name: Name of the table
+        rows: Source rows as dictionaries (the valid reference)
+        db_type: Database type ('mysql', 'postgresql', etc.)
+        ignored_columns: List of columns to ignore during insertion
+        max_rows: Maximum number of rows per statement
+        
+    Returns:
+        List[str]: INSERT query strings
+    """
+    escaped_table = escape_column_name(table_name, db_type)
+    queries = []
+    for columns, values in _bulk_insert_chunks(rows, ignored_columns, max_rows):
+        columns_clause = escape_and_join(columns, db_type)
+        tuples = ["(" + ", ".join([_sql_literal(val) for val in row_values]) + ")" for row_values in values]
+        queries.append(f"INSERT INTO {escaped_table} ({columns_clause}) VALUES {', '.join(tuples)};")
+    return queries
 
 
 def generate_update_query(
@@ -322,11 +766,14 @@ def generate_update_query(
     source_data: Dict[str, Any],
     target_data: Dict[str, Any],
     db_type: str,
-    ignored_columns: List[str] = None
+    ignored_columns: List[str] = None,
+    escapes: Tuple[str, Dict[str, str]] = None
 ) -> str:
     """
     Generate a MySQL UPDATE query to fix differences between source and target data.
     
+    Values are inlined as literals so the query can be written to a fix file.
+    
     Args:
         table_name: Name of the table
         identifier_columns: List of identifier column names (primary key or unique constraint)
@@ -335,6 +782,7 @@ def generate_update_query(
         target_data: Target row data as dictionary
         db_type: Database type ('mysql', 'postgresql', etc.)
         ignored_columns: List of columns to ignore during comparison
+        escapes: Precomputed identifiers from precompute_table_escapes (optional)
         
     Returns:
         str: MySQL UPDATE query string
@@ -343,95 +791,58 @@ def generate_update_query(
         ignored_columns = []
     
     # Find columns that have different values
-    different_columns = []
     update_values = []
-    
     for col in source_data.keys():
         if col in ignored_columns:
             continue
-            
-        source_val = source_data.get(col)
-        target_val = target_data.get(col)
         
+        source_val = source_data.get(col)
         # Compare values, handling None values
-        if source_val != target_val:
-            different_columns.append(col)
+        if source_val != target_data.get(col):
             update_values.append((col, source_val))
     
-    if not different_columns:
+    if not update_values:
         return None  # No differences found
     
+    escaped_table, escaped_cols = escapes or (escape_column_name(table_name, db_type), {})
+    
     # Build the WHERE clause for the identifier
-    escaped_table = escape_column_name(table_name, db_type)
     where_conditions = []
-    
     for i, col in enumerate(identifier_columns):
-        escaped_col = escape_column_name(col, db_type)
+        escaped_col = escaped_cols.get(col) or escape_column_name(col, db_type)
         val = identifier_values[i]
-        
         if val is None:
             where_conditions.append(f"{escaped_col} IS NULL")
         else:
-            # Handle different data types appropriately
-            if isinstance(val, str):
-                # Escape single quotes in strings
-                escaped_val = val.replace("'", "''")
-                where_conditions.append(f"{escaped_col} = '{escaped_val}'")
-            elif isinstance(val, (int, float)):
-                where_conditions.append(f"{escaped_col} = {val}")
-            elif isinstance(val, bool):
-                where_conditions.append(f"{escaped_col} = {1 if val else 0}")
-            else:
-                # For other types (dates, etc.), convert to string
-                escaped_val = str(val).replace("'", "''")
-                where_conditions.append(f"{escaped_col} = '{escaped_val}'")
-    
-    where_clause = " AND ".join(where_conditions)
+            where_conditions.append(f"{escaped_col} = {_sql_literal(val)}")
     
     # Build the SET clause
-    set_clauses = []
-    for col, val in update_values:
-        escaped_col = escape_column_name(col, db_type)
-        
-        if val is None:
-            set_clauses.append(f"{escaped_col} = NULL")
-        else:
-            # Handle different data types appropriately
-            if isinstance(val, str):
-                # Escape single quotes in strings
-                escaped_val = val.replace("'", "''")
-                set_clauses.append(f"{escaped_col} = '{escaped_val}'")
-            elif isinstance(val, (int, float)):
-                set_clauses.append(f"{escaped_col} = {val}")
-            elif isinstance(val, bool):
-                set_clauses.append(f"{escaped_col} = {1 if val else 0}")
-            else:
-                # For other types (dates, etc.), convert to string
-                escaped_val = str(val).replace("'", "''")
-                set_clauses.append(f"{escaped_col} = '{escaped_val}'")
-    
-    set_clause = ", ".join(set_clauses)
-    
-    # Build the complete UPDATE query
-    update_query = f"UPDATE {escaped_table} SET {set_clause} WHERE {where_clause};"
+    set_clauses = [
+        f"{escaped_cols.get(col) or escape_column_name(col, db_type)} = {_sql_literal(val)}"
+        for col, val in update_values
+    ]
     
-    return update_query
+    return f"UPDATE {escaped_table} SET {', '.join(set_clauses)} WHERE {' AND '.join(where_conditions)};"
 
 
 def generate_insert_query(
     table_name: str,
     source_data: Dict[str, Any],
     db_type: str,
-    ignored_columns: List[str] = None
+    ignored_columns: List[str] = None,
+    escapes: Tuple[str, Dict[str, str]] = None
 ) -> str:
     """
     Generate a MySQL INSERT query to add missing rows from source data.
     
+    Values are inlined as literals so the query can be written to a fix file.
+    
     Args:
         table_name: Name of the table
         source_data: Source row data as dictionary (the valid reference)
         db_type: Database type ('mysql', 'postgresql', etc.)
         ignored_columns: List of columns to ignore during insertion
+        escapes: Precomputed identifiers from precompute_table_escapes (optional)
         
     Returns:
         str: MySQL INSERT query string
@@ -440,47 +851,11 @@ def generate_insert_query(
         ignored_columns = []
     
     # Filter out ignored columns
-    insert_columns = []
-    insert_values = []
-    
-    for col, val in source_data.items():
-        if col in ignored_columns:
-            continue
-            
-        insert_columns.append(col)
-        insert_values.append(val)
-    
-    if not insert_columns:
+    insert_items = [(col, val) for col, val in source_data.items() if col not in ignored_columns]
+    if not insert_items:
         return None  # No columns to insert
     
-    # Build the INSERT query
-    escaped_table = escape_column_name(table_name, db_type)
-    escaped_columns = escape_column_list(insert_columns, db_type)
-    
-    # Build the VALUES clause
-    value_clauses = []
-    for val in insert_values:
-        if val is None:
-            value_clauses.append("NULL")
-        else:
-            # Handle different data types appropriately
-            if isinstance(val, str):
-                # Escape single quotes in strings
-                escaped_val = val.replace("'", "''")
-                value_clauses.append(f"'{escaped_val}'")
-            elif isinstance(val, (int, float)):
-                value_clauses.append(str(val))
-            elif isinstance(val, bool):
-                value_clauses.append(str(1 if val else 0))
-            else:
-                # For other types (dates, etc.), convert to string
-                escaped_val = str(val).replace("'", "''")
-                value_clauses.append(f"'{escaped_val}'")
-    
-    values_clause = ", ".join(value_clauses)
-    columns_clause = ", ".join(escaped_columns)
-    
-    # Build the complete INSERT query
-    insert_query = f"INSERT INTO {escaped_table} ({columns_clause}) VALUES ({values_clause});"
-    
-    return insert_query 
\ No newline at end of file
+    escaped_table, escaped_cols = escapes or (escape_column_name(table_name, db_type), {})
+    columns_clause = ", ".join([escaped_cols.get(col) or escape_column_name(col, db_type) for col, _ in insert_items])
+    values_clause = ", ".join([_sql_literal(val) for _, val in insert_items])
+    return f"INSERT INTO {escaped_table} ({columns_clause}) VALUES ({values_clause});"
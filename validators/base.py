@@ -1,11 +1,35 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.engine import Engine
 from sqlalchemy import text
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 from loguru import logger
+import sys
+import threading
+
+from utils.sql_utils import get_database_type, escape_column_name, get_table_row_counts, get_table_names, prime_reflection_cache
+
+# Serializes progress output from concurrently running validations
+_progress_lock = threading.Lock()
+
+
+def _print_progress(line: str) -> None:
+    """
+    Write one progress line to stdout.
+    
+    print() writes the text and the line end separately, which lets lines
+    from concurrent validations run together. The line is written in one
+    call under a lock instead, and left to stdout's own buffering rather
+    than flushed explicitly.
+    
+    Args:
+        line (str): Progress line, without the trailing newline
+    """
+    with _progress_lock:
+        sys.stdout.write(line + "\n")
 
 class BaseValidator(ABC):
-    def __init__(self, source_engine: Engine, target_engine: Engine, config: Dict[str, Any]):
+    def __init__(self, source_engine: Engine, target_engine: Engine, config: Dict[str, Any], tables: Optional[List[str]] = None):
         """
         Initialize the base validator.
         
@@ -13,11 +37,23 @@ class BaseValidator(ABC):
             source_engine (Engine): Source database engine
             target_engine (Engine): Target database engine
             config (Dict[str, Any]): Configuration dictionary
+            tables (Optional[List[str]]): Tables to validate, if already resolved from
+                the same configuration (e.g. by another validator); discovered otherwise
         """
         self.source_engine = source_engine
         self.target_engine = target_engine
         self.config = config
-        self.tables = self._get_tables_to_validate()
+        self.tables = list(tables) if tables is not None else self._get_tables_to_validate()
+        
+        # Reflect all tables up front so per-table schema lookups hit the cache
+        for engine in (source_engine, target_engine):
+            prime_reflection_cache(engine, self.tables)
+        
+        # Row counts fetched up front by prefetch_metadata, per engine
+        self._row_counts: Dict[Engine, Dict[str, int]] = {}
+        
+        # Fix queries generated by the last validate_all run, per table
+        self._fix_queries: Dict[str, List[str]] = {}
 
     def _get_database_type(self, engine: Engine) -> str:
         """
@@ -38,38 +74,25 @@ class BaseValidator(ABC):
         Returns:
             List[str]: List of table names to validate
         """
-        include_tables = self.config['tables']['include']
-        exclude_tables = self.config['tables']['exclude']
+        include_tables = self.config['tables'].get('include')
+        exclude_tables = self.config['tables'].get('exclude') or []
         
         # If include_tables is empty, get all tables
         if not include_tables:
-            with self.source_engine.connect() as conn:
-                db_type = self._get_database_type(self.source_engine)
-                
-                if db_type == 'postgresql':
-                    # PostgreSQL uses 'public' schema by default
-                    query = """
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = 'public'
-                        AND table_type = 'BASE TABLE'
-                    """
-                elif db_type == 'mysql':
-                    # MySQL uses the database name as the schema
-                    database_name = self.config['source_db']['database']
-                    query = f"""
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = '{database_name}'
-                        AND table_type = 'BASE TABLE'
-                    """
-                else:
-                    raise ValueError(f"Unsupported database type: {db_type}")
-                
-                logger.info(f"Discovering tables for {db_type} database")
-                result = conn.execute(text(query))
-                tables = [row[0] for row in result]
-                logger.info(f"Found {len(tables)} tables in source database: {tables}")
+            db_type = self._get_database_type(self.source_engine)
+            
+            if db_type == 'postgresql':
+                # PostgreSQL uses 'public' schema by default
+                schema = 'public'
+            elif db_type == 'mysql':
+                # MySQL uses the database name as the schema
+                schema = self.config['source_db']['database']
+            else:
+                raise ValueError(f"Unsupported database type: {db_type}")
+            
+            logger.info(f"Discovering tables for {db_type} database")
+            tables = get_table_names(self.source_engine, schema=schema)
+            logger.info(f"Found {len(tables)} tables in source database: {tables}")
         else:
             tables = include_tables
             
@@ -79,6 +102,46 @@ class BaseValidator(ABC):
         logger.info(f"Found {len(tables)} tables to validate")
         return tables
 
+    def prefetch_metadata(self, prefetched: Dict[Engine, Dict[str, int]] = None) -> Dict[Engine, Dict[str, int]]:
+        """
+        Fetch row counts for all tables with one batched query per engine.
+        
+        Validators built from the same configuration validate the same tables,
+        so the result of one validator can be passed to the others.
+        
+        Args:
+            prefetched (Dict[Engine, Dict[str, int]]): Row counts from another validator, if any
+            
+        Returns:
+            Dict[Engine, Dict[str, int]]: Row counts per engine and table
+        """
+        if prefetched is None:
+            prefetched = {
+                engine: get_table_row_counts(engine, self.tables)
+                for engine in (self.source_engine, self.target_engine)
+            }
+        self._row_counts = prefetched
+        return prefetched
+
+    def _get_table_row_count(self, table_name: str, engine: Engine) -> int:
+        """
+        Get the total row count for a table, using prefetched counts when available.
+        
+        Args:
+            table_name (str): Name of the table
+            engine (Engine): SQLAlchemy engine
+            
+        Returns:
+            int: Total number of rows in the table
+        """
+        row_count = self._row_counts.get(engine, {}).get(table_name)
+        if row_count is not None:
+            return row_count
+        
+        escaped_table = escape_column_name(table_name, get_database_type(engine))
+        with engine.connect() as conn:
+            return conn.execute(text(f"SELECT COUNT(*) FROM {escaped_table}")).scalar()
+
     @abstractmethod
     def validate_table(self, table_name: str) -> Dict[str, Any]:
         """
@@ -92,55 +155,128 @@ class BaseValidator(ABC):
         """
         pass
 
-    def validate_all(self) -> Dict[str, Any]:
+    def _collect_fix_queries(self, table_name: str, fix_queries: List[str]) -> None:
         """
-        Validate all configured tables.
+        Keep a table's fix queries until the run's fix query file is written.
+        
+        Concurrently validated tables each store under their own key, so
+        tables can't overwrite each other's queries.
         
+        Args:
+            table_name (str): Name of the table
+            fix_queries (List[str]): Fix queries generated for the table
+        """
+        self._fix_queries[table_name] = fix_queries
+
+    def _save_fix_queries(self, fix_queries: List[str], append: bool = False) -> None:
+        """
+        Save fix queries to a SQL file.
+        
+        Validators that collect fix queries override this.
+        
+        Args:
+            fix_queries (List[str]): Fix queries to write
+            append (bool): Append to the file instead of overwriting it
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not write fix queries")
+
+    def write_fix_queries(self, written_files: Set[str]) -> None:
+        """
+        Write the fix queries collected by the last validate_all run, in table order.
+        
+        A file is overwritten the first time it's written in a run and appended
+        to after that, so validators sharing a file keep each other's queries.
+        
+        Args:
+            written_files (Set[str]): Fix query files already written in this run; updated
+        """
+        fix_queries = [query for table in self.tables for query in self._fix_queries.get(table, [])]
+        if not fix_queries:
+            return
+        
+        fix_queries_file = self.fix_queries_file
+        self._save_fix_queries(fix_queries, append=fix_queries_file in written_files)
+        written_files.add(fix_queries_file)
+
+    def _validate_and_report(self, index: int, table: str) -> Dict[str, Any]:
+        """
+        Validate a single table and print its progress line.
+        
+        Args:
+            index (int): Position of the table in the validation run (1-based)
+            table (str): Name of the table to validate
+            
+        Returns:
+            Dict[str, Any]: Validation results for the table
+        """
+        validator_name = self.__class__.__name__
+        
+        # Each table's progress line is written in a single call so that
+        # concurrent validations don't interleave mid-line
+        progress = f"[{validator_name} {index}/{len(self.tables)}] Validating table: {table} ... "
+        try:
+            result = self.validate_table(table)
+            
+            # Print immediate result for this table
+            status = result.get("status", "unknown")
+            if status == "success":
+                _print_progress(progress + "✅ PASSED")
+            elif status == "mismatch":
+                if validator_name == "SampleValidator":
+                    source_count = result.get("source_count", 0)
+                    target_count = result.get("target_count", 0)
+                    _print_progress(progress + f"❌ FAILED (source: {source_count}, target: {target_count})")
+                elif validator_name == "RowCountValidator":
+                    diff = result.get("difference", 0)
+                    _print_progress(progress + f"❌ FAILED (Row count diff: {diff})")
+                elif validator_name == "HashValidator" and "mismatches" in result:
+                    mismatch_count = len(result["mismatches"])
+                    _print_progress(progress + f"❌ FAILED ({mismatch_count} hash mismatches)")
+                else:
+                    _print_progress(progress + "❌ FAILED")
+            elif status == "error":
+                error_msg = result.get("error", "Unknown error")
+                _print_progress(progress + f"⚠️  ERROR - {error_msg}")
+            else:
+                _print_progress(progress + f"❓ UNKNOWN STATUS - {status}")
+            
+            return result
+                
+        except Exception as e:
+            _print_progress(progress + f"⚠️  ERROR - {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+
+    def validate_all(self, workers: int = None) -> Dict[str, Any]:
+        """
+        Validate all configured tables, several at a time.
+        
+        Table validations are independent and I/O-bound, so they run on a pool
+        of worker threads that overlap their DB round-trips. Results keep the
+        configured table order.
+        
+        Args:
+            workers (int): Maximum number of tables validated at once
+                (default: validation.parallel_tables, 1 = sequential)
+            
         Returns:
             Dict[str, Any]: Validation results for all tables
         """
-        results = {}
+        if workers is None:
+            workers = self.config['validation'].get('parallel_tables', 1)
         validator_name = self.__class__.__name__
+        self._fix_queries = {}
         
-        print(f"\n🚀 Starting {validator_name} for {len(self.tables)} tables")
+        if workers <= 1 or len(self.tables) <= 1:
+            _print_progress(f"\n🚀 Starting {validator_name} for {len(self.tables)} tables")
+            results = {table: self._validate_and_report(i, table) for i, table in enumerate(self.tables, 1)}
+        else:
+            _print_progress(f"\n🚀 Starting {validator_name} for {len(self.tables)} tables ({workers} workers)")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                table_results = executor.map(self._validate_and_report, range(1, len(self.tables) + 1), self.tables)
+                results = dict(zip(self.tables, table_results))
         
-        for i, table in enumerate(self.tables, 1):
-            try:
-                print(f"[{i}/{len(self.tables)}] Validating table: {table}", end=" ... ")
-                result = self.validate_table(table)
-                results[table] = result
-                
-                # Print immediate result for this table
-                status = result.get("status", "unknown")
-                if status == "success":
-                    print("✅ PASSED")
-                elif status == "mismatch":
-                    if validator_name == "SampleValidator":
-                        source_count = result.get("source_count", 0)
-                        target_count = result.get("target_count", 0)
-                        print(f"❌ FAILED (source: {source_count}, target: {target_count})")
-                    elif validator_name == "RowCountValidator":
-                        source_count = result.get("source_count", 0)
-                        target_count = result.get("target_count", 0)
-                        diff = result.get("difference", 0)
-                        print(f"❌ FAILED (Row count diff: {diff})")
-                    elif validator_name == "HashValidator" and "mismatches" in result:
-                        mismatch_count = len(result["mismatches"])
-                        print(f"❌ FAILED ({mismatch_count} hash mismatches)")
-                    else:
-                        print("❌ FAILED")
-                elif status == "error":
-                    error_msg = result.get("error", "Unknown error")
-                    print(f"⚠️  ERROR - {error_msg}")
-                else:
-                    print(f"❓ UNKNOWN STATUS - {status}")
-                    
-            except Exception as e:
-                print(f"⚠️  ERROR - {str(e)}")
-                results[table] = {
-                    "status": "error",
-                    "error": str(e)
-                }
-        
-        print(f"✅ Completed {validator_name} validation")
-        return results 
\ No newline at end of file
+        _print_progress(f"✅ Completed {validator_name} validation")
+        return results
@@ -7,6 +7,13 @@ from validators.row_count import RowCountValidator
 from validators.hash_compare import HashValidator
 from validators.sample_compare import SampleValidator
 
+# Validator class per configured validation type
+_VALIDATOR_CLASSES = {
+    'row_count': RowCountValidator,
+    'hash_check': HashValidator,
+    'sample_comparison': SampleValidator,
+}
+
 class ValidatorFactory:
     @staticmethod
     def create_validators(
@@ -17,6 +24,9 @@ class ValidatorFactory:
         """
         Create validators based on configuration.
         
+        Tables to validate are discovered by the first validator created and
+        handed to the others, so discovery runs once.
+        
         Args:
             source_engine (Engine): Source database engine
             target_engine (Engine): Target database engine
@@ -27,17 +37,17 @@ class ValidatorFactory:
         """
         validators = []
         validation_types = config['validation']['types']
+        tables = None
         
         for vtype in validation_types:
             try:
-                if vtype == 'row_count':
-                    validators.append(RowCountValidator(source_engine, target_engine, config))
-                elif vtype == 'hash_check':
-                    validators.append(HashValidator(source_engine, target_engine, config))
-                elif vtype == 'sample_comparison':
-                    validators.append(SampleValidator(source_engine, target_engine, config))
-                else:
+                validator_class = _VALIDATOR_CLASSES.get(vtype)
+                if validator_class is None:
                     logger.warning(f"Unknown validation type: {vtype}")
+                    continue
+                validator = validator_class(source_engine, target_engine, config, tables)
+                validators.append(validator)
+                tables = validator.tables
             except Exception as e:
                 logger.error(f"Error creating validator for type {vtype}: {str(e)}")
         
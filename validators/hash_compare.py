@@ -1,20 +1,154 @@
-from sqlalchemy import text, MetaData, Table, select
-from typing import Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import text
+from typing import Dict, Any, List, Tuple, Iterator, Iterable, Callable
 import hashlib
 import json
+import queue
 import random
+import struct
+import threading
+from contextlib import closing
 from loguru import logger
 from validators.base import BaseValidator
 from utils.sql_utils import (
-    get_database_type, build_select_query, build_where_clause_for_pk, escape_column_name,
-    get_suitable_row_identifier, create_row_signature, generate_update_query, generate_insert_query
+    get_database_type, build_select_query, make_select_builder, make_pk_where_template,
+    build_where_clause_for_pk_fast, build_where_clause_for_pk_batch, build_row_hash_expression,
+    build_table_fingerprint_query, make_keyset_where, escape_column_name, escape_and_join, get_suitable_row_identifier, get_table_schema,
+    create_row_signatures_batch, make_row_signer, generate_update_query, generate_insert_query, precompute_table_escapes
 )
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+def _encode_str(val: str) -> bytes:
+    data = val.encode('utf-8', 'surrogatepass')
+    return b's' + struct.pack('<I', len(data)) + data
+
+
+def _encode_int(val: int) -> bytes:
+    if -0x8000000000000000 <= val <= 0x7FFFFFFFFFFFFFFF:
+        return b'q' + struct.pack('<q', val)
+    data = str(val).encode('ascii')
+    return b'i' + struct.pack('<I', len(data)) + data
+
+
+def _encode_float(val: float) -> bytes:
+    # All NaNs share one repr, so they must share one encoding
+    return b'd' + struct.pack('<d', val) if val == val else b'n'
+
+
+def _encode_other(val: Any) -> bytes:
+    # Subclasses of the primitive types keep their own repr; anything else
+    # (decimals, dates, ...) compares by its string form, like a str value
+    if isinstance(val, bool):
+        return b'T' if val else b'F'
+    if isinstance(val, (int, float, str)):
+        data = repr(val).encode('utf-8', 'surrogatepass')
+        return b'r' + struct.pack('<I', len(data)) + data
+    return _encode_str(str(val))
+
+
+# Hash input encoder per exact value type; other types go through _encode_other
+_HASH_VALUE_ENCODERS = {
+    type(None): lambda val: b'N',
+    bool: lambda val: b'T' if val else b'F',
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+}
+
+
+def _encode_row(row: Any) -> bytes:
+    encoder_for = _HASH_VALUE_ENCODERS.get
+    return b''.join([encoder_for(type(val), _encode_other)(val) for val in row])
+
+
+def _blake2b_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _md5_digest(data: bytes) -> bytes:
+    return hashlib.md5(data).digest()
+
+
+# 128-bit row digest per hash_algo setting; xxh3_128 and blake3 need their optional packages
+_ROW_DIGESTS = {
+    'blake2b': _blake2b_digest,
+    'md5': _md5_digest,
+}
+if xxhash is not None:
+    _ROW_DIGESTS['xxh3_128'] = xxhash.xxh3_128_digest
+if blake3 is not None:
+    _ROW_DIGESTS['blake3'] = lambda data: blake3.blake3(data).digest(length=16)
+
+
+def _prefetch(chunks: Iterable[List], depth: int = 2) -> Iterator[List]:
+    """
+    Iterate over chunks produced by a background thread, up to depth chunks ahead.
+    
+    Lets the next chunk be fetched from the database while the caller
+    processes the current one. Errors raised by the producer are re-raised
+    in the caller. When the caller stops early, the producer is stopped and
+    joined before returning, so it never outlives the connection it reads from.
+    
+    Args:
+        chunks (Iterable[List]): Non-empty chunks to produce
+        depth (int): Maximum number of chunks fetched ahead
+        
+    Yields:
+        List: Chunks in production order
+    """
+    items = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for chunk in chunks:
+                items.put((chunk, None))
+                if stop.is_set():
+                    return
+            items.put((None, None))
+        except BaseException as e:
+            items.put((None, e))
+    
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk, error = items.get()
+            if error is not None:
+                raise error
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue
+        while producer.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        producer.join()
+
+
 class HashValidator(BaseValidator):
-    def __init__(self, source_engine, target_engine, config):
-        super().__init__(source_engine, target_engine, config)
+    # Rows fetched per query when looking up mismatched rows by identifier
+    ROW_FETCH_BATCH_SIZE = 500
+    
+    def __init__(self, source_engine, target_engine, config, tables=None):
+        super().__init__(source_engine, target_engine, config, tables)
         self.chunk_size = config['validation']['chunk_size']
         self.ignored_columns = config['validation'].get('ignored_columns', [])
+        # Set form for membership tests against every column of every table
+        self._ignored_set = frozenset(self.ignored_columns)
         
         # Hash sampling configuration
         self.hash_sampling = config['validation'].get('hash_sampling', {})
@@ -23,6 +157,16 @@ class HashValidator(BaseValidator):
         self.sample_size = self.hash_sampling.get('sample_size', 10000)
         self.sample_method = self.hash_sampling.get('sample_method', 'random')
         
+        # Digest applied to each row's canonical bytes when hashing in Python
+        self.hash_algo = config['validation'].get('hash_algo', 'blake2b')
+        if self.hash_algo not in _ROW_DIGESTS:
+            logger.warning(f"Hash algorithm '{self.hash_algo}' is unknown or its package is not installed, using blake2b")
+            self.hash_algo = 'blake2b'
+        self._row_digest = _ROW_DIGESTS[self.hash_algo]
+        
+        # Hash rows on the database server instead of fetching every column
+        self.server_side_hash = config['validation'].get('server_side_hash', False)
+        
         # Detailed mismatch logging limit
         self.max_detailed_mismatches = config['validation'].get('max_detailed_mismatches', 20)
         
@@ -30,24 +174,12 @@ class HashValidator(BaseValidator):
         self.generate_fix_queries = config['validation'].get('generate_fix_queries', True)
         self.fix_queries_file = config['validation'].get('fix_queries_file', 'logs/fix-query.sql')
         self.max_fix_queries = config['validation'].get('max_fix_queries', None)  # None = unlimited
-
-    def _get_table_row_count(self, table_name: str, engine) -> int:
-        """
-        Get the total row count for a table.
         
-        Args:
-            table_name (str): Name of the table
-            engine: SQLAlchemy engine
-            
-        Returns:
-            int: Total number of rows in the table
-        """
-        db_type = get_database_type(engine)
-        escaped_table = escape_column_name(table_name, db_type)
-        query = text(f"SELECT COUNT(*) FROM {escaped_table}")
-        with engine.connect() as conn:
-            result = conn.execute(query).fetchone()
-            return result[0] if result else 0
+        # Parameterized primary key WHERE clause per (db_type, pk_columns), reused for every mismatched row
+        self._pk_where_templates: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        
+        # Escaped table and column names per table, reused for every generated fix query
+        self._table_escapes: Dict[str, Tuple[str, Dict[str, str]]] = {}
 
     def _filter_columns(self, columns: List[str]) -> List[str]:
         """
@@ -59,7 +191,7 @@ class HashValidator(BaseValidator):
         Returns:
             List[str]: Filtered column list without ignored columns
         """
-        return [col for col in columns if col not in self.ignored_columns]
+        return [col for col in columns if col not in self._ignored_set]
 
     def _get_row_identifier(self, table_name: str, engine, available_columns: List[str] = None) -> Tuple[List[str], str]:
         """
@@ -75,36 +207,114 @@ class HashValidator(BaseValidator):
         """
         return get_suitable_row_identifier(table_name, engine, available_columns)
 
-    def _generate_row_hash(self, row: Tuple, filtered_columns: List[str]) -> str:
+    def _row_hash_input(self, row: Tuple) -> bytes:
+        """
+        Build the canonical bytes of a row that _generate_row_hash digests.
+        
+        Values are taken positionally (validate_table ensures both sides use
+        the same column order) and encoded by type: integers and floats are
+        packed with struct, strings are length-prefixed UTF-8, and decimals,
+        dates and other complex types compare by their string form. Every
+        value carries a type tag, so 1, 1.0, True and '1' all hash differently.
+        
+        Args:
+            row (Tuple): Row data
+            
+        Returns:
+            bytes: Canonical row encoding
+        """
+        return _encode_row(row)
+
+    def _generate_row_hash(self, row: Tuple, filtered_columns: List[str]) -> bytes:
         """
         Generate a hash for a row of data using only the filtered columns.
         
+        The raw digest is kept rather than its hex form, halving the size of
+        the per-table hash maps; it's converted with .hex() only for output.
+        
         Args:
             row (Tuple): Row data
-            filtered_columns (List[str]): Columns to include in hash
+            filtered_columns (List[str]): Columns to include in hash, in row order
             
         Returns:
-            str: MD5 hash of the filtered row data
-        """
-        # Create dictionary with column names as keys for better consistency
-        # Use a more robust conversion that handles None, decimals, dates, etc.
-        row_dict = {}
-        for col, val in zip(filtered_columns, row):
-            if val is None:
-                row_dict[col] = None
-            elif isinstance(val, (int, float, str, bool)):
-                row_dict[col] = val
-            else:
-                # Handle decimals, dates, and other complex types by converting to string
-                row_dict[col] = str(val)
+            bytes: 128-bit digest (hash_algo, BLAKE2b by default) of the filtered row data
+        """
+        return self._row_digest(self._row_hash_input(row))
+
+    def _use_server_side_hash(self, identifier_type: str) -> bool:
+        """
+        Check whether row hashes can be computed by the databases themselves.
+        
+        Server-side digests are only comparable when both databases render
+        values the same way, and rows must be keyed by their identifier values.
+        
+        Args:
+            identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
+            
+        Returns:
+            bool: True if rows should be hashed on the server
+        """
+        if not self.server_side_hash or identifier_type not in ['primary_key', 'unique_constraint']:
+            return False
+        db_type = get_database_type(self.source_engine)
+        return db_type in ['postgresql', 'mysql'] and db_type == get_database_type(self.target_engine)
+
+    def _get_table_fingerprint(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str]) -> Tuple[int, str]:
+        """
+        Get a table's row count and a digest over all its row hashes, computed by the database.
+        
+        Args:
+            table_name (str): Name of the table
+            engine: SQLAlchemy engine
+            identifier_columns (List[str]): List of row identifier column names
+            filtered_columns (List[str]): Columns to include in hash calculation
+            
+        Returns:
+            Tuple[int, str]: (row count, fingerprint)
+        """
+        query = build_table_fingerprint_query(filtered_columns, table_name, get_database_type(engine), identifier_columns)
+        with engine.connect() as conn:
+            row_count, fingerprint = conn.execute(text(query)).fetchone()
+        return row_count, fingerprint
+
+    def _get_hash_select(self, db_type: str, identifier_columns: List[str], filtered_columns: List[str], identifier_type: str) -> Tuple[List[str], List[str]]:
+        """
+        Get what a hash query selects: all filtered columns, or only the
+        identifier columns plus a server-side row hash.
         
-        # Sort keys and create a consistent string representation
-        sorted_items = sorted(row_dict.items())
-        # Use a more deterministic serialization than JSON (which can vary)
-        hash_string = '|'.join([f"{k}:{repr(v)}" for k, v in sorted_items])
-        return hashlib.md5(hash_string.encode('utf-8')).hexdigest()
+        Args:
+            db_type (str): Database type
+            identifier_columns (List[str]): List of row identifier column names
+            filtered_columns (List[str]): Columns to include in hash calculation
+            identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
+            
+        Returns:
+            Tuple[List[str], List[str]]: (columns, SQL expressions) to select
+        """
+        if self._use_server_side_hash(identifier_type):
+            return list(identifier_columns), [build_row_hash_expression(filtered_columns, db_type)]
+        return filtered_columns, []
 
-    def _get_table_hashes_with_sampling(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, str]:
+    def _add_row_hashes(self, hashes: Dict[str, bytes], rows: List, signer: Callable[[Any], str], server_hashed: bool) -> None:
+        """
+        Add the hash of each fetched row to hashes, keyed by row signature.
+        
+        Args:
+            hashes (Dict[str, bytes]): Dictionary to add row hashes to
+            rows (List): Fetched rows
+            signer (Callable[[Any], str]): Row signer for the table, from make_row_signer
+            server_hashed (bool): Whether the last value of each row is its server-side hash (hex)
+        """
+        signatures = map(signer, rows)
+        if server_hashed:
+            for row_signature, row in zip(signatures, rows):
+                hashes[row_signature] = bytes.fromhex(row[-1])
+        else:
+            # Same digest as _generate_row_hash, without the per-row method calls
+            row_digest = self._row_digest
+            hashes.update(zip(signatures, [row_digest(_encode_row(row)) for row in rows]))
+
+    def _get_table_hashes_with_sampling(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, bytes]:
         """
         Get hashes for rows in a table using sampling for large tables.
         
@@ -117,7 +327,7 @@ class HashValidator(BaseValidator):
             identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
             
         Returns:
-            Dict[str, str]: Dictionary mapping row identifiers to row hashes
+            Dict[str, bytes]: Dictionary mapping row identifiers to row hashes
         """
         use_sampling = (self.sampling_enabled and 
                        total_rows > self.max_rows_for_full_scan)
@@ -129,7 +339,7 @@ class HashValidator(BaseValidator):
             logger.info(f"Table {table_name} has {total_rows:,} rows - using full scan")
             return self._get_all_table_hashes(table_name, engine, identifier_columns, filtered_columns, identifier_type)
 
-    def _get_sampled_table_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, str]:
+    def _get_sampled_table_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, bytes]:
         """
         Get hashes for a random sample of rows in a table.
         
@@ -141,18 +351,18 @@ class HashValidator(BaseValidator):
             total_rows (int): Total number of rows in the table
             
         Returns:
-            Dict[str, str]: Dictionary mapping primary key values to row hashes
+            Dict[str, bytes]: Dictionary mapping primary key values to row hashes
         """
         db_type = get_database_type(engine)
+        select_columns, expressions = self._get_hash_select(db_type, identifier_columns, filtered_columns, identifier_type)
         
         if db_type == 'mysql':
             # MySQL TABLESAMPLE is not widely supported, use ORDER BY RAND()
             # RAND() is a function, not a column, so we build the query manually
-            from utils.sql_utils import escape_column_list, escape_column_name
-            escaped_columns = escape_column_list(filtered_columns, db_type)
+            escaped_columns = ', '.join([escape_and_join(select_columns, db_type)] + expressions)
             escaped_table = escape_column_name(table_name, db_type)
             query = text(f"""
-                SELECT {', '.join(escaped_columns)}
+                SELECT {escaped_columns}
                 FROM {escaped_table}
                 ORDER BY RAND()
                 LIMIT {self.sample_size}
@@ -162,22 +372,20 @@ class HashValidator(BaseValidator):
             sample_percent = min(100, (self.sample_size / total_rows) * 100)
             if sample_percent < 0.01:  # If percentage is too small, use LIMIT with ORDER BY RANDOM()
                 # RANDOM() is a function, not a column, so we build the query manually
-                from utils.sql_utils import escape_column_list, escape_column_name
-                escaped_columns = escape_column_list(filtered_columns, db_type)
+                escaped_columns = ', '.join([escape_and_join(select_columns, db_type)] + expressions)
                 escaped_table = escape_column_name(table_name, db_type)
                 query = text(f"""
-                    SELECT {', '.join(escaped_columns)}
+                    SELECT {escaped_columns}
                     FROM {escaped_table}
                     ORDER BY RANDOM()
                     LIMIT {self.sample_size}
                 """)
             else:
                 # For TABLESAMPLE, we need to build manually since it's not a standard ORDER BY
-                from utils.sql_utils import escape_column_list, escape_column_name
-                escaped_columns = escape_column_list(filtered_columns, db_type)
+                escaped_columns = ', '.join([escape_and_join(select_columns, db_type)] + expressions)
                 escaped_table = escape_column_name(table_name, db_type)
                 query = text(f"""
-                    SELECT {', '.join(escaped_columns)}
+                    SELECT {escaped_columns}
                     FROM {escaped_table} TABLESAMPLE BERNOULLI({sample_percent})
                     LIMIT {self.sample_size}
                 """)
@@ -190,24 +398,12 @@ class HashValidator(BaseValidator):
         with engine.connect() as conn:
             logger.info(f"DEBUG: Executing sampling query: {query}")
             rows = conn.execute(query).fetchall()
-            
-            for row in rows:
-                # Get identifier values
-                identifier_values = []
-                for id_col in identifier_columns:
-                    if id_col in filtered_columns:
-                        id_index = filtered_columns.index(id_col)
-                        identifier_values.append(row[id_index])
-                
-                # Create row signature based on identifier type
-                row_signature = create_row_signature(identifier_values, identifier_columns, identifier_type)
-                row_hash = self._generate_row_hash(row, filtered_columns)
-                hashes[row_signature] = row_hash
+            self._add_row_hashes(hashes, rows, make_row_signer(select_columns, identifier_columns), bool(expressions))
         
         logger.info(f"Successfully sampled {len(hashes):,} rows from {table_name}")
         return hashes
 
-    def _get_chunked_sample_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, str]:
+    def _get_chunked_sample_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], total_rows: int, identifier_type: str) -> Dict[str, bytes]:
         """
         Get hashes using a chunked random sampling approach for databases that don't support native sampling.
         
@@ -219,7 +415,7 @@ class HashValidator(BaseValidator):
             total_rows (int): Total number of rows in the table
             
         Returns:
-            Dict[str, str]: Dictionary mapping primary key values to row hashes
+            Dict[str, bytes]: Dictionary mapping primary key values to row hashes
         """
         hashes = {}
         
@@ -230,52 +426,82 @@ class HashValidator(BaseValidator):
         sampled_count = 0
         offset = 0
         
-        while sampled_count < self.sample_size and offset < total_rows:
-            # Add some randomness to the offset
-            random_offset = offset + random.randint(0, chunk_interval - 1)
-            if random_offset >= total_rows:
-                break
+        # For tables without unique identifiers, ordering might be problematic
+        order_by_cols = identifier_columns if identifier_type != 'all_columns' else None
+        build_query = make_select_builder(filtered_columns, table_name, get_database_type(engine), order_by_cols)
+        signer = make_row_signer(filtered_columns, identifier_columns)
+        
+        with engine.connect() as conn:
+            while sampled_count < self.sample_size and offset < total_rows:
+                # Add some randomness to the offset
+                random_offset = offset + random.randint(0, chunk_interval - 1)
+                if random_offset >= total_rows:
+                    break
+                    
+                query = text(build_query(
+                    limit=min(chunk_sample_size, self.sample_size - sampled_count),
+                    offset=random_offset
+                ))
                 
-            # For tables without unique identifiers, ordering might be problematic
-            order_by_cols = identifier_columns if identifier_type != 'all_columns' else None
-            
-            query_str = build_select_query(
-                columns=filtered_columns,
-                table_name=table_name,
-                db_type=get_database_type(engine),
-                order_by=order_by_cols,
-                limit=min(chunk_sample_size, self.sample_size - sampled_count),
-                offset=random_offset
-            )
-            query = text(query_str)
-            
-            with engine.connect() as conn:
-                rows = conn.execute(query).fetchall()
+                rows = conn.execute(query).fetchall()[:self.sample_size - sampled_count]
                 
-                for row in rows:
-                    identifier_values = []
-                    for id_col in identifier_columns:
-                        if id_col in filtered_columns:
-                            id_index = filtered_columns.index(id_col)
-                            identifier_values.append(row[id_index])
-                    
-                    # Create row signature based on identifier type
-                    row_signature = create_row_signature(identifier_values, identifier_columns, identifier_type)
-                    row_hash = self._generate_row_hash(row, filtered_columns)
-                    hashes[row_signature] = row_hash
-                    sampled_count += 1
-                    
-                    if sampled_count >= self.sample_size:
-                        break
-            
-            offset += chunk_interval
+                self._add_row_hashes(hashes, rows, signer, False)
+                sampled_count += len(rows)
+                
+                offset += chunk_interval
         
         logger.info(f"Chunked sampling collected {len(hashes):,} rows from {table_name}")
         return hashes
 
-    def _get_all_table_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], identifier_type: str) -> Dict[str, str]:
+    def _iter_table_chunks(self, conn, build_query, select_columns: List[str], identifier_columns: List[str], identifier_type: str, db_type: str) -> Iterator[List]:
+        """
+        Read all rows of a table over one connection, chunk_size rows at a time.
+        
+        Tables with a primary key are paged by key (WHERE key > last key), so
+        each chunk is an index range scan. Other tables have no key to page by
+        and are read with one query through a server-side cursor.
+        
+        Args:
+            conn: SQLAlchemy connection
+            build_query: SELECT builder from make_select_builder
+            select_columns (List[str]): Columns selected, in row order
+            identifier_columns (List[str]): List of row identifier column names
+            identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
+            db_type (str): Database type
+            
+        Yields:
+            List: Non-empty chunks of rows
+        """
+        # Unique constraint columns may be NULL, which keyset comparisons would skip
+        if identifier_type != 'primary_key':
+            result = conn.execution_options(stream_results=True, yield_per=self.chunk_size).execute(text(build_query()))
+            for rows in result.partitions():
+                yield rows
+            return
+        
+        key_indices = [select_columns.index(col) for col in identifier_columns]
+        first_query = text(build_query(limit=self.chunk_size))
+        next_query = text(build_query(where_clause=make_keyset_where(identifier_columns, db_type), limit=self.chunk_size))
+        params = {}
+        
+        while True:
+            rows = conn.execute(next_query if params else first_query, params).fetchall()
+            if not rows:
+                return
+            
+            yield rows
+            if len(rows) < self.chunk_size:
+                return
+            
+            last_row = rows[-1]
+            params = {f"k{i}": last_row[index] for i, index in enumerate(key_indices)}
+
+    def _get_all_table_hashes(self, table_name: str, engine, identifier_columns: List[str], filtered_columns: List[str], identifier_type: str) -> Dict[str, bytes]:
         """
-        Get hashes for all rows in a table (original implementation).
+        Get hashes for all rows in a table over a single connection.
+        
+        When rows are hashed in Python, the next chunk is fetched on a
+        background thread while the current one is hashed.
         
         Args:
             table_name (str): Name of the table
@@ -284,44 +510,26 @@ class HashValidator(BaseValidator):
             filtered_columns (List[str]): Columns to include in hash calculation
             
         Returns:
-            Dict[str, str]: Dictionary mapping primary key values to row hashes
+            Dict[str, bytes]: Dictionary mapping primary key values to row hashes
         """
         hashes = {}
-        offset = 0
         
-        while True:
-            # For tables without unique identifiers, ordering might be problematic
-            order_by_cols = identifier_columns if identifier_type != 'all_columns' else None
-            
-            query_str = build_select_query(
-                columns=filtered_columns,
-                table_name=table_name,
-                db_type=get_database_type(engine),
-                order_by=order_by_cols,
-                limit=self.chunk_size,
-                offset=offset
-            )
-            query = text(query_str)
+        # For tables without unique identifiers, ordering might be problematic
+        order_by_cols = identifier_columns if identifier_type != 'all_columns' else None
+        db_type = get_database_type(engine)
+        select_columns, expressions = self._get_hash_select(db_type, identifier_columns, filtered_columns, identifier_type)
+        build_query = make_select_builder(select_columns, table_name, db_type, order_by_cols, expressions)
+        server_hashed = bool(expressions)
+        signer = make_row_signer(select_columns, identifier_columns)
+        
+        with engine.connect() as conn:
+            chunks = self._iter_table_chunks(conn, build_query, select_columns, identifier_columns, identifier_type, db_type)
+            if not server_hashed:
+                chunks = _prefetch(chunks)
             
-            with engine.connect() as conn:
-                rows = conn.execute(query).fetchall()
-                
-            if not rows:
-                break
-                
-            for row in rows:
-                identifier_values = []
-                for id_col in identifier_columns:
-                    if id_col in filtered_columns:
-                        id_index = filtered_columns.index(id_col)
-                        identifier_values.append(row[id_index])
-                
-                # Create row signature based on identifier type
-                row_signature = create_row_signature(identifier_values, identifier_columns, identifier_type)
-                row_hash = self._generate_row_hash(row, filtered_columns)
-                hashes[row_signature] = row_hash
-                
-            offset += self.chunk_size
+            with closing(chunks):
+                for rows in chunks:
+                    self._add_row_hashes(hashes, rows, signer, server_hashed)
             
         return hashes
 
@@ -341,7 +549,11 @@ class HashValidator(BaseValidator):
         """
         try:
             db_type = get_database_type(engine)
-            where_clause = build_where_clause_for_pk(pk_columns, pk_values, db_type)
+            template_key = (db_type, tuple(pk_columns))
+            template = self._pk_where_templates.get(template_key)
+            if template is None:
+                template = self._pk_where_templates[template_key] = make_pk_where_template(pk_columns, db_type)
+            where_clause, params = build_where_clause_for_pk_fast(template, pk_values)
             
             query_str = build_select_query(
                 columns=final_columns,
@@ -352,7 +564,7 @@ class HashValidator(BaseValidator):
             query = text(query_str)
             
             with engine.connect() as conn:
-                row = conn.execute(query).fetchone()
+                row = conn.execute(query, params).fetchone()
                 if row:
                     return {col: row[i] for i, col in enumerate(final_columns)}
                 return {}
@@ -360,7 +572,67 @@ class HashValidator(BaseValidator):
             logger.error(f"Error fetching row data for logging: {str(e)}")
             return {}
 
-    def _log_detailed_mismatch(self, table_name: str, row_identifier: str, identifier_columns: List[str], final_columns: List[str], mismatch_count: int, identifier_type: str, source_hash: str = None, target_hash: str = None):
+    def _get_rows_data_batch(self, table_name: str, engine, pk_columns: List[str], final_columns: List[str], row_identifiers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get row data for many rows, fetching up to ROW_FETCH_BATCH_SIZE rows per query.
+        
+        Args:
+            table_name (str): Name of the table
+            engine: SQLAlchemy engine
+            pk_columns (List[str]): Primary key column names
+            final_columns (List[str]): Columns to include
+            row_identifiers (List[str]): Row identifiers ('|'-joined identifier values) to fetch
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Row data as dictionary per row identifier; rows
+            that were not found (or whose batch failed) are left out
+        """
+        rows_data = {}
+        db_type = get_database_type(engine)
+        build_query = make_select_builder(final_columns, table_name, db_type)
+        
+        for start in range(0, len(row_identifiers), self.ROW_FETCH_BATCH_SIZE):
+            batch = row_identifiers[start:start + self.ROW_FETCH_BATCH_SIZE]
+            try:
+                where_clause, params = build_where_clause_for_pk_batch(
+                    pk_columns, [tuple(row_id.split('|')) for row_id in batch], db_type
+                )
+                with engine.connect() as conn:
+                    rows = conn.execute(text(build_query(where_clause=where_clause)), params).fetchall()
+                
+                signatures = create_row_signatures_batch(rows, final_columns, pk_columns, 'primary_key')
+                for row_signature, row in zip(signatures, rows):
+                    rows_data[row_signature] = {col: row[i] for i, col in enumerate(final_columns)}
+            except Exception as e:
+                logger.error(f"Error fetching row data for {len(batch)} rows of {table_name}: {str(e)}")
+        
+        return rows_data
+
+    def _get_rows_data_both(self, table_name: str, pk_columns: List[str], final_columns: List[str], source_identifiers: List[str], target_identifiers: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        Get row data from source and target at the same time, each over its own connection.
+        
+        Args:
+            table_name (str): Name of the table
+            pk_columns (List[str]): Primary key column names
+            final_columns (List[str]): Columns to include
+            source_identifiers (List[str]): Row identifiers to fetch from the source
+            target_identifiers (List[str]): Row identifiers to fetch from the target
+            
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]: (source rows, target rows)
+            by row identifier
+        """
+        if not target_identifiers:
+            return self._get_rows_data_batch(table_name, self.source_engine, pk_columns, final_columns, source_identifiers), {}
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(self._get_rows_data_batch, table_name, self.source_engine, pk_columns, final_columns, source_identifiers)
+            target_future = executor.submit(self._get_rows_data_batch, table_name, self.target_engine, pk_columns, final_columns, target_identifiers)
+            return source_future.result(), target_future.result()
+
+    def _log_detailed_mismatch(self, table_name: str, row_identifier: str, identifier_columns: List[str], final_columns: List[str], mismatch_count: int, identifier_type: str, source_hash: str = None, target_hash: str = None,
+                               source_row: Dict[str, Any] = None, target_row: Dict[str, Any] = None):
         """
         Log detailed information about hash mismatches.
         
@@ -373,6 +645,8 @@ class HashValidator(BaseValidator):
             identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
             source_hash (str): Hash from source database
             target_hash (str): Hash from target database
+            source_row (Dict[str, Any]): Already fetched source row data (optional)
+            target_row (Dict[str, Any]): Already fetched target row data (optional)
         """
         logger.info(f"=== HASH MISMATCH #{mismatch_count} IN TABLE '{table_name}' ===")
         logger.info(f"Row identifier ({identifier_type}): {row_identifier}")
@@ -387,9 +661,11 @@ class HashValidator(BaseValidator):
             # Parse the row identifier back to individual values
             pk_values = tuple(row_identifier.split('|'))
             
-            # Get detailed row data from both databases
-            source_row = self._get_row_data_for_logging(table_name, self.source_engine, identifier_columns, final_columns, pk_values)
-            target_row = self._get_row_data_for_logging(table_name, self.target_engine, identifier_columns, final_columns, pk_values)
+            # Get detailed row data from both databases, unless already fetched
+            if source_row is None:
+                source_row = self._get_row_data_for_logging(table_name, self.source_engine, identifier_columns, final_columns, pk_values)
+            if target_row is None:
+                target_row = self._get_row_data_for_logging(table_name, self.target_engine, identifier_columns, final_columns, pk_values)
         else:
             logger.warning(f"Detailed row comparison not available for tables without unique identifiers")
             source_row = {}
@@ -414,8 +690,8 @@ class HashValidator(BaseValidator):
             try:
                 computed_source_hash = self._generate_row_hash(tuple(source_row_for_hash), final_columns)
                 computed_target_hash = self._generate_row_hash(tuple(target_row_for_hash), final_columns)
-                logger.info(f"Computed source hash: {computed_source_hash}")
-                logger.info(f"Computed target hash: {computed_target_hash}")
+                logger.info(f"Computed source hash: {computed_source_hash.hex()}")
+                logger.info(f"Computed target hash: {computed_target_hash.hex()}")
                 
                 if computed_source_hash != computed_target_hash:
                     logger.info("✓ Hash computation confirms mismatch")
@@ -461,6 +737,23 @@ class HashValidator(BaseValidator):
         
         logger.info("=" * 60)
 
+    def _get_table_escapes(self, table_name: str, final_columns: List[str], db_type: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Get the escaped table and column names for fix queries, computed once per table.
+        
+        Args:
+            table_name: Name of the table
+            final_columns: List of columns used for comparison
+            db_type: Database type of the target
+            
+        Returns:
+            Tuple[str, Dict[str, str]]: (escaped_table, escaped name per column)
+        """
+        escapes = self._table_escapes.get(table_name)
+        if escapes is None:
+            escapes = self._table_escapes[table_name] = precompute_table_escapes(table_name, final_columns, db_type)
+        return escapes
+
     def _generate_fix_query(self, table_name: str, row_identifier: str, identifier_columns: List[str], 
                            final_columns: List[str], identifier_type: str, source_row: Dict[str, Any], 
                            target_row: Dict[str, Any]) -> str:
@@ -498,7 +791,8 @@ class HashValidator(BaseValidator):
                 source_data=source_row,
                 target_data=target_row,
                 db_type=db_type,
-                ignored_columns=self.ignored_columns
+                ignored_columns=self._ignored_set,
+                escapes=self._get_table_escapes(table_name, final_columns, db_type)
             )
             
             return update_query
@@ -536,7 +830,8 @@ class HashValidator(BaseValidator):
                 table_name=table_name,
                 source_data=source_row,
                 db_type=db_type,
-                ignored_columns=self.ignored_columns
+                ignored_columns=self._ignored_set,
+                escapes=self._get_table_escapes(table_name, final_columns, db_type)
             )
             
             return insert_query
@@ -545,12 +840,88 @@ class HashValidator(BaseValidator):
             logger.error(f"Error generating insert query for table {table_name}: {str(e)}")
             return None
 
-    def _save_fix_queries(self, fix_queries: List[str]) -> None:
+    def _log_detailed_mismatches(self, table_name: str, logged_mismatches: List[Tuple[str, str, str]], identifier_columns: List[str], final_columns: List[str], identifier_type: str) -> None:
+        """
+        Log detailed information for several hash mismatches, fetching their rows in batches.
+        
+        Args:
+            table_name (str): Name of the table
+            logged_mismatches (List[Tuple[str, str, str]]): (row_identifier, source_hash, target_hash) per mismatch
+            identifier_columns (List[str]): Row identifier column names
+            final_columns (List[str]): Columns used for hashing
+            identifier_type (str): Type of identifier (primary_key, unique_constraint, all_columns)
+        """
+        source_rows = {}
+        target_rows = {}
+        if identifier_type in ['primary_key', 'unique_constraint'] and logged_mismatches:
+            row_ids = [row_id for row_id, _, _ in logged_mismatches]
+            source_rows, target_rows = self._get_rows_data_both(table_name, identifier_columns, final_columns, row_ids, row_ids)
+        
+        for i, (row_id, source_hash, target_hash) in enumerate(logged_mismatches, 1):
+            self._log_detailed_mismatch(
+                table_name, row_id, identifier_columns, final_columns, i, identifier_type, source_hash, target_hash,
+                source_rows.get(row_id, {}), target_rows.get(row_id, {})
+            )
+
+    def _generate_fix_queries_batch(self, table_name: str, fix_candidates: List[Tuple[str, str]], identifier_columns: List[str], final_columns: List[str], identifier_type: str) -> List[str]:
+        """
+        Generate UPDATE and INSERT fix queries, fetching the affected rows in batches.
+        
+        Rows are fetched one batch at a time, so no more rows are read than
+        needed to reach max_fix_queries.
+        
+        Args:
+            table_name (str): Name of the table
+            fix_candidates (List[Tuple[str, str]]): (row_identifier, 'update' or 'insert') per row, in output order
+            identifier_columns (List[str]): Row identifier column names
+            final_columns (List[str]): Columns used for comparison
+            identifier_type (str): Type of identifier
+            
+        Returns:
+            List[str]: Fix queries
+        """
+        fix_queries = []
+        
+        for start in range(0, len(fix_candidates), self.ROW_FETCH_BATCH_SIZE):
+            if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
+                break
+            
+            batch = fix_candidates[start:start + self.ROW_FETCH_BATCH_SIZE]
+            # Missing rows only need their source data; updates need both sides
+            source_rows, target_rows = self._get_rows_data_both(
+                table_name, identifier_columns, final_columns,
+                [row_id for row_id, _ in batch], [row_id for row_id, action in batch if action == 'update']
+            )
+            
+            for row_id, action in batch:
+                if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
+                    break
+                
+                try:
+                    source_row = source_rows.get(row_id)
+                    if action == 'insert':
+                        # Source data is the valid reference for the missing row
+                        fix_query = self._generate_insert_query(table_name, row_id, identifier_columns, final_columns, identifier_type, source_row) if source_row else None
+                    else:
+                        target_row = target_rows.get(row_id)
+                        fix_query = self._generate_fix_query(table_name, row_id, identifier_columns, final_columns, identifier_type, source_row, target_row) if source_row and target_row else None
+                    if fix_query:
+                        fix_queries.append(fix_query)
+                except Exception as e:
+                    logger.error(f"Error generating {action} query for row {row_id}: {str(e)}")
+        
+        if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries and len(fix_candidates) > len(fix_queries):
+            logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
+        
+        return fix_queries
+
+    def _save_fix_queries(self, fix_queries: List[str], append: bool = False) -> None:
         """
         Save fix queries to a SQL file.
         
         Args:
             fix_queries: List of SQL UPDATE and INSERT queries
+            append: Append to the file instead of overwriting it
         """
         if not fix_queries:
             return
@@ -560,7 +931,7 @@ class HashValidator(BaseValidator):
             import os
             os.makedirs(os.path.dirname(self.fix_queries_file), exist_ok=True)
             
-            with open(self.fix_queries_file, 'w') as f:
+            with open(self.fix_queries_file, 'a' if append else 'w') as f:
                 f.write("-- Auto-generated fix queries for data differences\n")
                 f.write("-- Generated by db-checker\n")
                 f.write("-- Execute these queries on the TARGET database to fix differences\n")
@@ -617,37 +988,17 @@ class HashValidator(BaseValidator):
                     source_hash = self._generate_row_hash(tuple(source_tuple), final_columns)
                     target_hash = self._generate_row_hash(tuple(target_tuple), final_columns)
                     
-                    logger.info(f"Source hash: {source_hash}")
-                    logger.info(f"Target hash: {target_hash}")
+                    logger.info(f"Source hash: {source_hash.hex()}")
+                    logger.info(f"Target hash: {target_hash.hex()}")
                     logger.info(f"Hashes match: {source_hash == target_hash}")
                     
                     # Show hash input string
-                    source_dict = {}
-                    target_dict = {}
-                    for col, val in zip(final_columns, source_tuple):
-                        if val is None:
-                            source_dict[col] = None
-                        elif isinstance(val, (int, float, str, bool)):
-                            source_dict[col] = val
-                        else:
-                            source_dict[col] = str(val)
-                    
-                    for col, val in zip(final_columns, target_tuple):
-                        if val is None:
-                            target_dict[col] = None
-                        elif isinstance(val, (int, float, str, bool)):
-                            target_dict[col] = val
-                        else:
-                            target_dict[col] = str(val)
-                    
-                    source_sorted = sorted(source_dict.items())
-                    target_sorted = sorted(target_dict.items())
-                    source_hash_string = '|'.join([f"{k}:{repr(v)}" for k, v in source_sorted])
-                    target_hash_string = '|'.join([f"{k}:{repr(v)}" for k, v in target_sorted])
+                    source_hash_string = self._row_hash_input(tuple(source_tuple))
+                    target_hash_string = self._row_hash_input(tuple(target_tuple))
                     
-                    logger.info(f"Source hash string: {source_hash_string}")
-                    logger.info(f"Target hash string: {target_hash_string}")
-                    logger.info(f"Hash strings match: {source_hash_string == target_hash_string}")
+                    logger.info(f"Source hash input: {source_hash_string!r}")
+                    logger.info(f"Target hash input: {target_hash_string!r}")
+                    logger.info(f"Hash inputs match: {source_hash_string == target_hash_string}")
                     
                 except Exception as e:
                     logger.error(f"Error generating debug hashes: {str(e)}")
@@ -666,19 +1017,15 @@ class HashValidator(BaseValidator):
         """
         try:
             # First, check if table structures match
-            metadata_source = MetaData()
-            table_source = Table(table_name, metadata_source, autoload_with=self.source_engine)
-            source_columns = [c.name for c in table_source.columns]
-            
-            metadata_target = MetaData()
-            table_target = Table(table_name, metadata_target, autoload_with=self.target_engine)
-            target_columns = [c.name for c in table_target.columns]
+            source_columns = list(get_table_schema(table_name, self.source_engine).columns)
+            target_columns = list(get_table_schema(table_name, self.target_engine).columns)
             
             # Filter out ignored columns for comparison
             source_filtered = self._filter_columns(source_columns)
             target_filtered = self._filter_columns(target_columns)
             
-            logger.info(f"Ignored columns for {table_name}: {[col for col in target_columns if col in self.ignored_columns]}")
+            ignored_in_table = [col for col in target_columns if col in self._ignored_set]
+            logger.info(f"Ignored columns for {table_name}: {ignored_in_table}")
             
             # Check for column differences (excluding ignored columns)
             if set(source_filtered) != set(target_filtered):
@@ -743,8 +1090,46 @@ class HashValidator(BaseValidator):
             source_row_count = self._get_table_row_count(table_name, self.source_engine)
             target_row_count = self._get_table_row_count(table_name, self.target_engine)
             
-            source_hashes = self._get_table_hashes_with_sampling(table_name, self.source_engine, source_identifier, final_columns, source_row_count, source_id_type)
-            target_hashes = self._get_table_hashes_with_sampling(table_name, self.target_engine, target_identifier, final_columns, target_row_count, target_id_type)
+            # With server-side hashing, first compare whole-table fingerprints and skip
+            # the per-row scan when they match. Only primary keys guarantee distinct
+            # rows; unique constraints allow NULLs, so duplicate rows could cancel out
+            if (source_id_type == 'primary_key' and self._use_server_side_hash(source_id_type)
+                    and source_row_count == target_row_count):
+                try:
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        source_future = executor.submit(self._get_table_fingerprint, table_name, self.source_engine, source_identifier, final_columns)
+                        target_future = executor.submit(self._get_table_fingerprint, table_name, self.target_engine, target_identifier, final_columns)
+                        source_fingerprint = source_future.result()
+                        target_fingerprint = target_future.result()
+                except Exception as e:
+                    logger.warning(f"Could not compute table fingerprints for {table_name}, comparing rows: {str(e)}")
+                    source_fingerprint = target_fingerprint = None
+                
+                if source_fingerprint is not None and source_fingerprint == target_fingerprint:
+                    logger.info(f"Hash validation successful for table {table_name} - table fingerprints match ({source_fingerprint[0]:,} rows)")
+                    return {
+                        "status": "success",
+                        "total_rows_source": source_fingerprint[0],
+                        "total_rows_target": target_fingerprint[0],
+                        "sampled_rows_source": source_fingerprint[0],
+                        "sampled_rows_target": target_fingerprint[0],
+                        "compared_rows": source_fingerprint[0],
+                        "sampling_used": False,
+                        "sample_size": None,
+                        "mismatches": [],
+                        "fix_queries_generated": 0,
+                        "columns_used": final_columns,
+                        "ignored_columns": ignored_in_table
+                    }
+                elif source_fingerprint is not None:
+                    logger.info(f"Table fingerprints differ for {table_name}, comparing rows")
+            
+            # Source and target are scanned over separate connections, so both scans can run at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                source_future = executor.submit(self._get_table_hashes_with_sampling, table_name, self.source_engine, source_identifier, final_columns, source_row_count, source_id_type)
+                target_future = executor.submit(self._get_table_hashes_with_sampling, table_name, self.target_engine, target_identifier, final_columns, target_row_count, target_id_type)
+                source_hashes = source_future.result()
+                target_hashes = target_future.result()
             
             # Determine if sampling was used
             sampling_used = (self.sampling_enabled and 
@@ -754,7 +1139,10 @@ class HashValidator(BaseValidator):
             # Compare hashes - only for rows that exist in both samples
             mismatches = []
             mismatch_count = 0
-            fix_queries = []  # Collect fix queries for differences
+            # Rows needing fix queries and detailed logs, looked up in batches once the comparison is done
+            generate_fixes = self.generate_fix_queries and source_id_type in ['primary_key', 'unique_constraint']
+            fix_candidates = []
+            logged_mismatches = []
             
             # Get intersection of sampled rows to avoid false positives from inconsistent sampling
             common_row_ids = set(source_hashes.keys()) & set(target_hashes.keys())
@@ -769,7 +1157,6 @@ class HashValidator(BaseValidator):
                     logger.info(f"Sampling note: {len(source_only_rows):,} rows only in source sample, {len(target_only_rows):,} rows only in target sample (this is normal with random sampling)")
                 
                 # Only compare hash mismatches for common rows
-                detailed_logged_count = 0
                 for row_id in common_row_ids:
                     source_hash = source_hashes[row_id]
                     target_hash = target_hashes[row_id]
@@ -778,108 +1165,40 @@ class HashValidator(BaseValidator):
                         mismatches.append({
                             "row_identifier": row_id,
                             "status": "hash_mismatch",
-                            "source_hash": source_hash,
-                            "target_hash": target_hash
+                            "source_hash": source_hash.hex(),
+                            "target_hash": target_hash.hex()
                         })
                         
-                        # Generate fix query if enabled and we have unique identifiers
-                        if self.generate_fix_queries and source_id_type in ['primary_key', 'unique_constraint']:
-                            # Check if we've reached the maximum number of fix queries
-                            if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
-                                if len(fix_queries) == self.max_fix_queries:
-                                    logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
-                                continue
-                            
-                            try:
-                                # Get detailed row data for fix query generation
-                                pk_values = tuple(row_id.split('|'))
-                                source_row = self._get_row_data_for_logging(table_name, self.source_engine, source_identifier, final_columns, pk_values)
-                                target_row = self._get_row_data_for_logging(table_name, self.target_engine, source_identifier, final_columns, pk_values)
-                                
-                                if source_row and target_row:
-                                    fix_query = self._generate_fix_query(table_name, row_id, source_identifier, final_columns, source_id_type, source_row, target_row)
-                                    if fix_query:
-                                        fix_queries.append(fix_query)
-                            except Exception as e:
-                                logger.error(f"Error generating fix query for row {row_id}: {str(e)}")
-                        
-                        # Log detailed mismatch information only if under the limit
-                        if detailed_logged_count < self.max_detailed_mismatches:
-                            detailed_logged_count += 1
-                            self._log_detailed_mismatch(table_name, row_id, source_identifier, final_columns, detailed_logged_count, source_id_type, source_hash, target_hash)
-                        elif detailed_logged_count == self.max_detailed_mismatches:
-                            # Log summary when limit is reached
-                            logger.info(f"📋 Detailed logging limit reached ({self.max_detailed_mismatches} mismatches). Additional mismatches will be counted but not logged in detail.")
-                            detailed_logged_count += 1  # Increment to avoid logging this message again
+                        if generate_fixes:
+                            fix_candidates.append((row_id, 'update'))
+                        if len(logged_mismatches) < self.max_detailed_mismatches:
+                            logged_mismatches.append((row_id, source_hash.hex(), target_hash.hex()))
             else:
                 # For full scan mode, missing rows are actual data issues
-                detailed_logged_count = 0
                 for row_id, source_hash in source_hashes.items():
                     if row_id not in target_hashes:
                         mismatches.append({
                             "row_identifier": row_id,
                             "status": "missing_in_target",
-                            "source_hash": source_hash
+                            "source_hash": source_hash.hex()
                         })
                         logger.warning(f"Row missing in target - Identifier: {row_id}")
                         
-                        # Generate INSERT query if enabled and we have unique identifiers
-                        if self.generate_fix_queries and source_id_type in ['primary_key', 'unique_constraint']:
-                            # Check if we've reached the maximum number of fix queries
-                            if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
-                                if len(fix_queries) == self.max_fix_queries:
-                                    logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
-                                continue
-                            
-                            try:
-                                # Get detailed row data from source for INSERT query generation
-                                pk_values = tuple(row_id.split('|'))
-                                source_row = self._get_row_data_for_logging(table_name, self.source_engine, source_identifier, final_columns, pk_values)
-                                
-                                if source_row:
-                                    insert_query = self._generate_insert_query(table_name, row_id, source_identifier, final_columns, source_id_type, source_row)
-                                    if insert_query:
-                                        fix_queries.append(insert_query)
-                            except Exception as e:
-                                logger.error(f"Error generating insert query for row {row_id}: {str(e)}")
+                        if generate_fixes:
+                            fix_candidates.append((row_id, 'insert'))
                     elif target_hashes[row_id] != source_hash:
                         mismatch_count += 1
                         mismatches.append({
                             "row_identifier": row_id,
                             "status": "hash_mismatch",
-                            "source_hash": source_hash,
-                            "target_hash": target_hashes[row_id]
+                            "source_hash": source_hash.hex(),
+                            "target_hash": target_hashes[row_id].hex()
                         })
                         
-                        # Generate fix query if enabled and we have unique identifiers
-                        if self.generate_fix_queries and source_id_type in ['primary_key', 'unique_constraint']:
-                            # Check if we've reached the maximum number of fix queries
-                            if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
-                                if len(fix_queries) == self.max_fix_queries:
-                                    logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
-                                continue
-                            
-                            try:
-                                # Get detailed row data for fix query generation
-                                pk_values = tuple(row_id.split('|'))
-                                source_row = self._get_row_data_for_logging(table_name, self.source_engine, source_identifier, final_columns, pk_values)
-                                target_row = self._get_row_data_for_logging(table_name, self.target_engine, source_identifier, final_columns, pk_values)
-                                
-                                if source_row and target_row:
-                                    fix_query = self._generate_fix_query(table_name, row_id, source_identifier, final_columns, source_id_type, source_row, target_row)
-                                    if fix_query:
-                                        fix_queries.append(fix_query)
-                            except Exception as e:
-                                logger.error(f"Error generating fix query for row {row_id}: {str(e)}")
-                        
-                        # Log detailed mismatch information only if under the limit
-                        if detailed_logged_count < self.max_detailed_mismatches:
-                            detailed_logged_count += 1
-                            self._log_detailed_mismatch(table_name, row_id, source_identifier, final_columns, detailed_logged_count, source_id_type, source_hash, target_hashes[row_id])
-                        elif detailed_logged_count == self.max_detailed_mismatches:
-                            # Log summary when limit is reached
-                            logger.info(f"📋 Detailed logging limit reached ({self.max_detailed_mismatches} mismatches). Additional mismatches will be counted but not logged in detail.")
-                            detailed_logged_count += 1  # Increment to avoid logging this message again
+                        if generate_fixes:
+                            fix_candidates.append((row_id, 'update'))
+                        if len(logged_mismatches) < self.max_detailed_mismatches:
+                            logged_mismatches.append((row_id, source_hash.hex(), target_hashes[row_id].hex()))
                 
                 # Check for rows in target but not in source (only for full scan)
                 for row_id in target_hashes:
@@ -887,13 +1206,21 @@ class HashValidator(BaseValidator):
                         mismatches.append({
                             "row_identifier": row_id,
                             "status": "missing_in_source",
-                            "target_hash": target_hashes[row_id]
+                            "target_hash": target_hashes[row_id].hex()
                         })
                         logger.warning(f"Row missing in source - Identifier: {row_id}")
             
-            # Save fix queries if any were generated
+            # Log detailed mismatch information only up to the limit
+            self._log_detailed_mismatches(table_name, logged_mismatches, source_identifier, final_columns, source_id_type)
+            if mismatch_count > self.max_detailed_mismatches:
+                logger.info(f"📋 Detailed logging limit reached ({self.max_detailed_mismatches} mismatches). Additional mismatches will be counted but not logged in detail.")
+            
+            # Generate UPDATE/INSERT fix queries for the differences
+            fix_queries = self._generate_fix_queries_batch(table_name, fix_candidates, source_identifier, final_columns, source_id_type) if fix_candidates else []
+            
+            # Keep fix queries for the run's fix query file, written once all tables are done
             if fix_queries and self.generate_fix_queries:
-                self._save_fix_queries(fix_queries)
+                self._collect_fix_queries(table_name, fix_queries)
             
             result = {
                 "status": "success" if not mismatches else "mismatch",
@@ -907,7 +1234,7 @@ class HashValidator(BaseValidator):
                 "mismatches": mismatches,
                 "fix_queries_generated": len(fix_queries) if self.generate_fix_queries else 0,
                 "columns_used": final_columns,
-                "ignored_columns": [col for col in target_columns if col in self.ignored_columns]
+                "ignored_columns": ignored_in_table
             }
             
             if mismatches:
@@ -942,7 +1269,7 @@ class HashValidator(BaseValidator):
                 if mismatch_count > 0:  # Only show instruction if there were hash mismatches (not just missing rows)
                     logger.info(f"📋 For detailed row-by-row comparison of mismatched data, check: logs/data_checker.log")
                 if fix_queries and self.generate_fix_queries:
-                    logger.info(f"🔧 Generated {len(fix_queries)} fix queries (UPDATE and INSERT) saved to: {self.fix_queries_file}")
+                    logger.info(f"🔧 Generated {len(fix_queries)} fix queries (UPDATE and INSERT) will be saved to: {self.fix_queries_file}")
             else:
                 if sampling_used:
                     logger.info(f"Hash validation successful for table {table_name} - {len(common_row_ids):,} compared rows matched")
@@ -1,15 +1,18 @@
-from sqlalchemy import text, MetaData, Table
+from sqlalchemy import text
 from typing import Dict, Any, List, Tuple
 from loguru import logger
 from validators.base import BaseValidator
 from utils.sql_utils import (
-    get_database_type, escape_column_name, build_select_query, 
-    get_suitable_row_identifier, create_row_signature, generate_insert_query
+    get_database_type, build_select_query, make_select_builder, build_where_clause_for_pk_batch,
+    get_suitable_row_identifier, get_table_schema, generate_bulk_insert_queries
 )
 
 class RowCountValidator(BaseValidator):
-    def __init__(self, source_engine, target_engine, config):
-        super().__init__(source_engine, target_engine, config)
+    # Missing rows fetched per query when generating INSERT queries
+    ROW_FETCH_BATCH_SIZE = 500
+    
+    def __init__(self, source_engine, target_engine, config, tables=None):
+        super().__init__(source_engine, target_engine, config, tables)
         
         # Missing row detection configuration
         self.missing_detection_config = config['validation'].get('row_count_missing_detection', {})
@@ -37,9 +40,7 @@ class RowCountValidator(BaseValidator):
         """
         try:
             # Get table metadata to find available columns
-            metadata = MetaData()
-            table = Table(table_name, metadata, autoload_with=engine)
-            available_columns = [c.name for c in table.columns]
+            available_columns = list(get_table_schema(table_name, engine).columns)
             
             # Get suitable row identifier columns
             identifier_columns, identifier_type = get_suitable_row_identifier(
@@ -60,17 +61,11 @@ class RowCountValidator(BaseValidator):
                 limit=limit
             )
             
-            # Execute query and get identifiers
-            row_identifiers = []
+            # Execute query and get identifiers; composite identifiers are '|'-joined
+            # so they can be logged and split back into key values for INSERTs
             with engine.connect() as conn:
                 result = conn.execute(text(query))
-                for row in result:
-                    if len(identifier_columns) == 1:
-                        row_identifiers.append(str(row[0]))
-                    else:
-                        # Create composite identifier
-                        identifier_values = [str(row[i]) for i in range(len(identifier_columns))]
-                        row_identifiers.append(create_row_signature(identifier_values, identifier_columns, identifier_type))
+                row_identifiers = ['|'.join([str(val) for val in row]) for row in result]
             
             return identifier_columns, row_identifiers, identifier_type
             
@@ -122,101 +117,81 @@ class RowCountValidator(BaseValidator):
                     break
             logger.info("=" * 60)
 
-    def _get_row_data_for_insert(self, table_name: str, engine, identifier_columns: List[str], 
-                                identifier_values: Tuple, all_columns: List[str]) -> Dict[str, Any]:
+    def _get_rows_data_for_insert(self, table_name: str, engine, identifier_columns: List[str], 
+                                  row_identifiers: List[str], all_columns: List[str]) -> List[Dict[str, Any]]:
         """
-        Get complete row data for generating INSERT queries.
+        Get complete row data for generating INSERT queries, ROW_FETCH_BATCH_SIZE rows per query.
         
         Args:
             table_name (str): Name of the table
             engine: SQLAlchemy engine
             identifier_columns (List[str]): Column names used for identification
-            identifier_values (Tuple): Values for the identifier columns
+            row_identifiers (List[str]): Row identifiers ('|'-joined identifier values) to fetch
             all_columns (List[str]): All columns to fetch
             
         Returns:
-            Dict[str, Any]: Row data as dictionary
+            List[Dict[str, Any]]: Row data as dictionaries; rows that were not found
+            (or whose batch failed) are left out
         """
-        try:
-            db_type = get_database_type(engine)
-            
-            # Build WHERE clause for identifier columns
-            where_conditions = []
-            for i, col in enumerate(identifier_columns):
-                escaped_col = escape_column_name(col, db_type)
-                val = identifier_values[i]
-                if val is None:
-                    where_conditions.append(f"{escaped_col} IS NULL")
-                else:
-                    where_conditions.append(f"{escaped_col} = '{val}'")
-            
-            where_clause = " AND ".join(where_conditions)
-            
-            # Use build_select_query for proper column escaping
-            query_str = build_select_query(
-                columns=all_columns,
-                table_name=table_name,
-                db_type=db_type,
-                where_clause=where_clause,
-                limit=1
-            )
-            
-            with engine.connect() as conn:
-                result = conn.execute(text(query_str))
-                row = result.fetchone()
-                
-                if row:
-                    return dict(zip(all_columns, row))
-                else:
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error getting row data for table {table_name}: {str(e)}")
-            return None
+        rows_data = []
+        db_type = get_database_type(engine)
+        build_query = make_select_builder(all_columns, table_name, db_type)
+        
+        with engine.connect() as conn:
+            for start in range(0, len(row_identifiers), self.ROW_FETCH_BATCH_SIZE):
+                batch = row_identifiers[start:start + self.ROW_FETCH_BATCH_SIZE]
+                try:
+                    # Parse the row identifiers back to individual values
+                    where_clause, params = build_where_clause_for_pk_batch(
+                        identifier_columns, [tuple(row_id.split('|')) for row_id in batch], db_type
+                    )
+                    rows = conn.execute(text(build_query(where_clause=where_clause)), params).fetchall()
+                    rows_data.extend(dict(zip(all_columns, row)) for row in rows)
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(f"Error fetching {len(batch)} rows of {table_name} for insert queries: {str(e)}")
+        
+        return rows_data
     
-    def _generate_insert_query(self, table_name: str, row_identifier: str, identifier_columns: List[str], 
-                             identifier_type: str, source_row: Dict[str, Any]) -> str:
+    def _generate_insert_queries(self, table_name: str, identifier_type: str, source_rows: List[Dict[str, Any]]) -> List[str]:
         """
-        Generate a MySQL INSERT query to add missing rows from source data.
+        Generate multi-row MySQL INSERT queries to add missing rows from source data.
         
         Args:
             table_name (str): Name of the table
-            row_identifier (str): Row identifier value
-            identifier_columns (List[str]): List of identifier column names
             identifier_type (str): Type of identifier
-            source_row (Dict[str, Any]): Source row data (the valid reference)
+            source_rows (List[Dict[str, Any]]): Source rows (the valid reference)
             
         Returns:
-            str: MySQL INSERT query or None if no unique identifier available
+            List[str]: MySQL INSERT queries, empty if no unique identifier available
         """
         if identifier_type not in ['primary_key', 'unique_constraint']:
             logger.warning(f"Cannot generate insert query for table {table_name} - no unique identifier available")
-            return None
+            return []
         
         try:
             # Get database type for proper escaping
             db_type = get_database_type(self.target_engine)
             
-            # Generate the INSERT query using source data as the valid reference
-            insert_query = generate_insert_query(
+            # Generate the INSERT queries using source data as the valid reference
+            return generate_bulk_insert_queries(
                 table_name=table_name,
-                source_data=source_row,
+                rows=source_rows,
                 db_type=db_type,
                 ignored_columns=self.ignored_columns
             )
             
-            return insert_query
-            
         except Exception as e:
-            logger.error(f"Error generating insert query for table {table_name}: {str(e)}")
-            return None
+            logger.error(f"Error generating insert queries for table {table_name}: {str(e)}")
+            return []
     
-    def _save_fix_queries(self, fix_queries: List[str]) -> None:
+    def _save_fix_queries(self, fix_queries: List[str], append: bool = False) -> None:
         """
         Save fix queries to a SQL file.
         
         Args:
             fix_queries: List of SQL INSERT queries
+            append: Append to the file instead of overwriting it
         """
         if not fix_queries:
             return
@@ -226,7 +201,7 @@ class RowCountValidator(BaseValidator):
             import os
             os.makedirs(os.path.dirname(self.fix_queries_file), exist_ok=True)
             
-            with open(self.fix_queries_file, 'w') as f:
+            with open(self.fix_queries_file, 'a' if append else 'w') as f:
                 f.write("-- Auto-generated INSERT queries for missing rows\n")
                 f.write("-- Generated by db-checker\n")
                 f.write("-- Execute these queries on the TARGET database to add missing rows\n")
@@ -252,20 +227,8 @@ class RowCountValidator(BaseValidator):
             Dict[str, Any]: Validation results including row counts and status
         """
         try:
-            # Get database types and escape table name
-            source_db_type = get_database_type(self.source_engine)
-            target_db_type = get_database_type(self.target_engine)
-            
-            source_table_escaped = escape_column_name(table_name, source_db_type)
-            target_table_escaped = escape_column_name(table_name, target_db_type)
-            
-            # Get source row count
-            with self.source_engine.connect() as conn:
-                source_count = conn.execute(text(f"SELECT COUNT(*) FROM {source_table_escaped}")).scalar()
-            
-            # Get target row count
-            with self.target_engine.connect() as conn:
-                target_count = conn.execute(text(f"SELECT COUNT(*) FROM {target_table_escaped}")).scalar()
+            source_count = self._get_table_row_count(table_name, self.source_engine)
+            target_count = self._get_table_row_count(table_name, self.target_engine)
             
             # Calculate difference
             diff = source_count - target_count
@@ -325,41 +288,24 @@ class RowCountValidator(BaseValidator):
                             logger.info(f"🔧 Generating INSERT queries for {len(missing_in_target)} missing rows in target...")
                             
                             # Get table metadata to get all columns
-                            metadata = MetaData()
-                            source_table = Table(table_name, metadata, autoload_with=self.source_engine)
-                            all_columns = [c.name for c in source_table.columns]
+                            all_columns = list(get_table_schema(table_name, self.source_engine).columns)
+                            
+                            # Fetch the missing rows from source, up to the fix query limit (counted in rows)
+                            rows_to_fetch = missing_in_target
+                            if self.max_fix_queries is not None and len(rows_to_fetch) > self.max_fix_queries:
+                                logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
+                                rows_to_fetch = rows_to_fetch[:self.max_fix_queries]
+                            
+                            source_rows = self._get_rows_data_for_insert(
+                                table_name, self.source_engine, source_id_cols, rows_to_fetch, all_columns
+                            )
                             
-                            for row_id in missing_in_target:
-                                # Check if we've reached the maximum number of fix queries
-                                if self.max_fix_queries is not None and len(fix_queries) >= self.max_fix_queries:
-                                    if len(fix_queries) == self.max_fix_queries:
-                                        logger.info(f"🔧 Fix query limit reached ({self.max_fix_queries}). Additional fix queries will not be generated.")
-                                    break
-                                
-                                try:
-                                    # Parse the row identifier back to individual values
-                                    if '|' in row_id:
-                                        pk_values = tuple(row_id.split('|'))
-                                    else:
-                                        pk_values = (row_id,)
-                                    
-                                    # Get complete row data from source
-                                    source_row = self._get_row_data_for_insert(
-                                        table_name, self.source_engine, source_id_cols, pk_values, all_columns
-                                    )
-                                    
-                                    if source_row:
-                                        insert_query = self._generate_insert_query(
-                                            table_name, row_id, source_id_cols, source_id_type, source_row
-                                        )
-                                        if insert_query:
-                                            fix_queries.append(insert_query)
-                                except Exception as e:
-                                    logger.error(f"Error generating insert query for row {row_id}: {str(e)}")
+                            # Rows sharing a column set are combined into multi-row INSERTs
+                            fix_queries = self._generate_insert_queries(table_name, source_id_type, source_rows)
                             
-                            # Save fix queries if any were generated
+                            # Keep fix queries for the run's fix query file, written once all tables are done
                             if fix_queries:
-                                self._save_fix_queries(fix_queries)
+                                self._collect_fix_queries(table_name, fix_queries)
                         elif self.generate_fix_queries and missing_in_target and diff <= 0:
                             logger.info(f"⚠️ Target has {abs(diff)} more rows than source - skipping INSERT query generation")
                             logger.info(f"📋 Missing row analysis shows {len(missing_in_target)} rows in source but not in target")
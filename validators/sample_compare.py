@@ -3,11 +3,10 @@ from typing import Dict, Any, List, Tuple
 import random
 from loguru import logger
 from validators.base import BaseValidator
-from utils.sql_utils import get_database_type, escape_column_name
 
 class SampleValidator(BaseValidator):
-    def __init__(self, source_engine, target_engine, config):
-        super().__init__(source_engine, target_engine, config)
+    def __init__(self, source_engine, target_engine, config, tables=None):
+        super().__init__(source_engine, target_engine, config, tables)
 
     def validate_table(self, table_name: str) -> Dict[str, Any]:
         """
@@ -20,17 +19,8 @@ class SampleValidator(BaseValidator):
             Dict[str, Any]: Validation results
         """
         try:
-            # Get source row count with proper escaping
-            source_db_type = get_database_type(self.source_engine)
-            source_table_escaped = escape_column_name(table_name, source_db_type)
-            with self.source_engine.connect() as conn:
-                source_count = conn.execute(text(f"SELECT COUNT(*) FROM {source_table_escaped}")).scalar()
-            
-            # Get target row count with proper escaping
-            target_db_type = get_database_type(self.target_engine)
-            target_table_escaped = escape_column_name(table_name, target_db_type)
-            with self.target_engine.connect() as conn:
-                target_count = conn.execute(text(f"SELECT COUNT(*) FROM {target_table_escaped}")).scalar()
+            source_count = self._get_table_row_count(table_name, self.source_engine)
+            target_count = self._get_table_row_count(table_name, self.target_engine)
             
             # Compare counts
             counts_match = source_count == target_count
@@ -0,0 +1,333 @@
+import io
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any
+from loguru import logger
+
+from validators.factory import ValidatorFactory
+
+def run_validation(source_engine, target_engine, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run the validation process using configured validators.
+    
+    Args:
+        source_engine: Source database engine
+        target_engine: Target database engine
+        config (Dict[str, Any]): Configuration dictionary
+        
+    Returns:
+        Dict[str, Any]: Validation results
+    """
+    try:
+        # Log ignored columns configuration
+        ignored_columns = config['validation'].get('ignored_columns', [])
+        if ignored_columns:
+            logger.info("Hash validation will ignore these columns: {}", ignored_columns)
+        else:
+            logger.info("No columns configured to be ignored during hash validation")
+        
+        # Create validators
+        validators = ValidatorFactory.create_validators(source_engine, target_engine, config)
+        
+        if not validators:
+            return {
+                "status": "error",
+                "error": "No validators configured"
+            }
+        
+        # Count rows for every table in one batched query per engine, shared by all validators
+        prefetched = None
+        for validator in validators:
+            prefetched = validator.prefetch_metadata(prefetched)
+        
+        # Run all validators
+        results = {}
+        all_summary = {
+            "total_tables": 0,
+            "passed_tables": set(),
+            "failed_tables": set(),
+            "error_tables": set()
+        }
+        
+        # Validators are I/O-bound on DB round-trips, so run them concurrently,
+        # each one also spreading its tables over `parallel_tables` workers
+        parallel_tables = config['validation'].get('parallel_tables', 1)
+        with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+            futures = {}
+            for validator in validators:
+                logger.info("Running {}", validator.__class__.__name__)
+                futures[executor.submit(validator.validate_all, parallel_tables)] = validator
+            
+            for future in as_completed(futures):
+                results[futures[future].__class__.__name__] = future.result()
+        
+        # Fix query files are written once per run, after every table is done, in
+        # configured validator order; validators sharing a file append to it
+        written_fix_files = set()
+        for validator in validators:
+            validator.write_fix_queries(written_fix_files)
+        
+        # Summaries are generated after the join, in configured order, to keep output readable
+        for validator in validators:
+            validator_name = validator.__class__.__name__
+            validator_results = results[validator_name]
+            
+            # Generate summary for this validator
+            summary = _generate_validator_summary(validator_name, validator_results)
+            
+            # Update overall summary
+            if all_summary["total_tables"] == 0:  # First validator sets the baseline
+                all_summary["total_tables"] = summary["total_tables"]
+            
+            # Track tables by their worst status across all validators
+            for table in summary["passed_tables"]:
+                if table not in all_summary["failed_tables"] and table not in all_summary["error_tables"]:
+                    all_summary["passed_tables"].add(table)
+            
+            for table in summary["failed_tables"]:
+                if table not in all_summary["error_tables"]:
+                    all_summary["passed_tables"].discard(table)
+                    all_summary["failed_tables"].add(table)
+            
+            for table in summary["error_tables"]:
+                all_summary["passed_tables"].discard(table)
+                all_summary["failed_tables"].discard(table)
+                all_summary["error_tables"].add(table)
+        
+        # Print overall summary
+        _print_overall_summary(all_summary)
+        
+        return {
+            "status": "success",
+            "results": results,
+            "summary": {
+                "total_tables": all_summary["total_tables"],
+                "passed_tables": sorted(all_summary["passed_tables"]),
+                "failed_tables": sorted(all_summary["failed_tables"]),
+                "error_tables": sorted(all_summary["error_tables"])
+            }
+        }
+        
+    except Exception as e:
+        logger.error("Validation failed: {}", e)
+        return {
+            "status": "error",
+            "error": str(e)
+        }
+
+def _generate_validator_summary(validator_name: str, validator_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate summary statistics for a single validator.
+    
+    Args:
+        validator_name (str): Name of the validator
+        validator_results (Dict[str, Any]): Validation results for all tables
+        
+    Returns:
+        Dict[str, Any]: Summary statistics
+    """
+    # Partition tables by status in a single pass
+    buckets = defaultdict(list)
+    for table_name, result in validator_results.items():
+        buckets[result.get("status")].append(table_name)
+    
+    passed_tables = buckets["success"]
+    failed_tables = buckets["mismatch"]
+    error_tables = buckets["error"]
+    
+    # Only failed tables can carry hash mismatches or missing rows
+    has_hash_mismatches = False
+    has_missing_rows = False
+    if validator_name == "HashValidator":
+        # Check for actual hash mismatches (not just missing rows)
+        has_hash_mismatches = any(
+            m.get("status") == "hash_mismatch"
+            for table_name in failed_tables
+            for m in validator_results[table_name].get("mismatches", [])
+        )
+    elif validator_name == "RowCountValidator":
+        # Check for rows identified by missing row detection
+        has_missing_rows = any(
+            validator_results[table_name].get("missing_in_target") or validator_results[table_name].get("missing_in_source")
+            for table_name in failed_tables
+        )
+    
+    total_tables = len(validator_results)
+    
+    # Print validator-specific summary with clean formatting, buffered into a single write
+    out = io.StringIO()
+    print(f"\n{'='*60}", file=out)
+    print(f"VALIDATION SUMMARY - {validator_name}", file=out)
+    print(f"{'='*60}", file=out)
+    print(f"Total tables validated: {total_tables}", file=out)
+    print(f"✅ Passed: {len(passed_tables)} tables", file=out)
+    print(f"❌ Failed: {len(failed_tables)} tables", file=out)
+    print(f"⚠️  Errors: {len(error_tables)} tables", file=out)
+    
+    if passed_tables:
+        print(f"\n✅ PASSED TABLES:", file=out)
+        for table in sorted(passed_tables):
+            print(f"   • {table}", file=out)
+    
+    if failed_tables:
+        print(f"\n❌ FAILED TABLES:", file=out)
+        format_failed = _FAILED_TABLE_FORMATTERS.get(validator_name, _format_failed_default)
+        for table in sorted(failed_tables):
+            print(format_failed(table, validator_results[table]), file=out)
+    
+    if error_tables:
+        print(f"\n⚠️  ERROR TABLES:", file=out)
+        for table in sorted(error_tables):
+            error_msg = validator_results[table].get("error", "Unknown error")
+            print(f"   • {table}: {error_msg}", file=out)
+    
+    # Add detailed log instruction for hash validator with mismatches
+    if validator_name == "HashValidator" and has_hash_mismatches:
+        print(f"\n📋 DETAILED LOGS:", file=out)
+        print(f"   For row-by-row data comparison of mismatched records,", file=out)
+        print(f"   check the detailed logs at: logs/data_checker.log", file=out)
+    
+    # Add detailed log instruction for row count validator with missing rows
+    if validator_name == "RowCountValidator" and has_missing_rows:
+        print(f"\n📋 DETAILED LOGS:", file=out)
+        print(f"   For detailed missing row identifiers,", file=out)
+        print(f"   check the detailed logs at: logs/data_checker.log", file=out)
+    
+    print(f"{'='*60}", file=out)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    
+    return {
+        "total_tables": total_tables,
+        "passed_tables": passed_tables,
+        "failed_tables": failed_tables,
+        "error_tables": error_tables
+    }
+
+def _format_failed_sample(table: str, result: Dict[str, Any]) -> str:
+    """
+    Format a failed-table summary line for SampleValidator.
+    
+    Args:
+        table (str): Name of the failed table
+        result (Dict[str, Any]): Validation result for the table
+        
+    Returns:
+        str: Summary line for the table
+    """
+    return f"   • {table} (source: {result.get('source_count', 0)}, target: {result.get('target_count', 0)})"
+
+def _format_failed_row_count(table: str, result: Dict[str, Any]) -> str:
+    """
+    Format a failed-table summary line for RowCountValidator.
+    
+    Args:
+        table (str): Name of the failed table
+        result (Dict[str, Any]): Validation result for the table
+        
+    Returns:
+        str: Summary line for the table
+    """
+    details = (
+        f"source: {result.get('source_count', 0)}, target: {result.get('target_count', 0)}, "
+        f"diff: {result.get('difference', 0)}"
+    )
+    if result.get("missing_detection_performed", False):
+        missing_in_target = result.get("missing_in_target")
+        missing_in_source = result.get("missing_in_source")
+        if missing_in_target:
+            details += f", {len(missing_in_target)} missing in target"
+        if missing_in_source:
+            details += f", {len(missing_in_source)} missing in source"
+    return f"   • {table} ({details})"
+
+def _format_failed_hash(table: str, result: Dict[str, Any]) -> str:
+    """
+    Format a failed-table summary line for HashValidator.
+    
+    Args:
+        table (str): Name of the failed table
+        result (Dict[str, Any]): Validation result for the table
+        
+    Returns:
+        str: Summary line for the table
+    """
+    mismatches = result.get("mismatches")
+    if mismatches is None:
+        return f"   • {table}"
+    
+    details = f"{len(mismatches)} hash mismatches"
+    if result.get("sampling_used", False):
+        sampled_rows = result.get("sampled_rows_source", 0)
+        total_rows = result.get("total_rows_source", 0)
+        details += f" in sampled {sampled_rows:,}/{total_rows:,} rows"
+    ignored_cols = result.get("ignored_columns")
+    if ignored_cols:
+        details += f", ignored: {ignored_cols}"
+    return f"   • {table} ({details})"
+
+def _format_failed_default(table: str, result: Dict[str, Any]) -> str:
+    """
+    Format a failed-table summary line for validators without specific details.
+    
+    Args:
+        table (str): Name of the failed table
+        result (Dict[str, Any]): Validation result for the table
+        
+    Returns:
+        str: Summary line for the table
+    """
+    return f"   • {table}"
+
+# Failed-table line formatters, resolved once per validator rather than per table
+_FAILED_TABLE_FORMATTERS = {
+    "SampleValidator": _format_failed_sample,
+    "RowCountValidator": _format_failed_row_count,
+    "HashValidator": _format_failed_hash
+}
+
+def _print_overall_summary(summary: Dict[str, Any]) -> None:
+    """
+    Print overall validation summary across all validators.
+    
+    Args:
+        summary (Dict[str, Any]): Overall summary statistics
+    """
+    total = summary["total_tables"]
+    
+    # Sort each status group once
+    passed_tables = sorted(summary["passed_tables"])
+    failed_tables = sorted(summary["failed_tables"])
+    error_tables = sorted(summary["error_tables"])
+    passed = len(passed_tables)
+    failed = len(failed_tables)
+    errors = len(error_tables)
+    
+    # Buffer the report so it is emitted in a single write
+    out = io.StringIO()
+    print(f"\n{'='*60}", file=out)
+    print(f"OVERALL VALIDATION SUMMARY", file=out)
+    print(f"{'='*60}", file=out)
+    print(f"Total tables: {total}", file=out)
+    
+    if total > 0:
+        print(f"✅ Fully matched: {passed} tables ({passed/total*100:.1f}%)", file=out)
+        print(f"❌ Mismatched: {failed} tables ({failed/total*100:.1f}%)", file=out)
+        print(f"⚠️  Errors: {errors} tables ({errors/total*100:.1f}%)", file=out)
+    else:
+        print("⚠️  No tables found to validate", file=out)
+        print("   Check your database configuration and table discovery settings", file=out)
+    
+    for heading, tables in (
+        ("✅ FULLY MATCHED TABLES", passed_tables),
+        ("❌ TABLES WITH MISMATCHES", failed_tables),
+        ("⚠️  TABLES WITH ERRORS", error_tables)
+    ):
+        if tables:
+            print(f"\n{heading}:", file=out)
+            print("\n".join(f"   • {table}" for table in tables), file=out)
+    
+    print(f"{'='*60}", file=out)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()